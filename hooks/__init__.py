@@ -10,82 +10,301 @@ Use `_` prefix to control ordering (e.g., `_default.py` runs first).
 
 Extract Interface (registration-time):
     def extract(folder_path: Path, current_data: dict) -> dict
+    parallel = True  # optional: safe to run concurrently with other hooks
 
 Lifecycle Interface (startup/shutdown):
     def on_startup(context: dict) -> None
     def on_shutdown(context: dict) -> None
+
+This package may also be imported from a prebuilt hooks.pyz archive
+(see scripts/build_hooks_pyz.py); hooks.local/ is always read from disk.
 """
 
+import importlib
 import importlib.util
+import json
 import logging
+import os
 import sys
 from pathlib import Path
+from types import ModuleType
 from typing import Optional
 
 log = logging.getLogger("screenshot-tool.hooks")
 
+# Path of the hooks.pyz archive when imported through zipimport
+_ARCHIVE: Optional[str] = getattr(__spec__.loader, "archive", None) if __spec__ else None
+_ARCHIVE_PREFIX = "screenshot_tool_hooks/"
+
 HOOKS_DIR = Path(__file__).parent
-HOOKS_LOCAL_DIR = HOOKS_DIR.parent / "hooks.local"
+if _ARCHIVE:
+    HOOKS_LOCAL_DIR = Path(_ARCHIVE).parent / "hooks.local"
+else:
+    HOOKS_LOCAL_DIR = HOOKS_DIR.parent / "hooks.local"
 
 
 def _hook_dirs() -> list[Path]:
-    dirs = [HOOKS_DIR]
-    if HOOKS_LOCAL_DIR.is_dir():
-        dirs.append(HOOKS_LOCAL_DIR)
-    return dirs
+    return [HOOKS_DIR, HOOKS_LOCAL_DIR]
+
+
+# (hook_name, hook_file_path, is_package); paths stay plain strings since
+# they are only ever handed to importlib.
+HookEntry = tuple[str, str, bool]
+
+# Discovered hooks, reused across run_all(), list_hooks() and lifecycle
+# points. Cleared by invalidate_hook_cache().
+_HOOKS_CACHE: Optional[list[HookEntry]] = None
+
+# Loaded hook modules keyed by (file path, st_mtime_ns, st_size), so an
+# unchanged file is executed once and an edited one is reloaded.
+_MODULE_CACHE: dict[tuple[str, int, int], ModuleType] = {}
+
 
+def invalidate_hook_cache() -> None:
+    """Forget discovered hooks and loaded modules (forces a rescan)."""
+    global _HOOKS_CACHE
+    _HOOKS_CACHE = None
+    for module in _MODULE_CACHE.values():
+        sys.modules.pop(module.__name__, None)
+    _MODULE_CACHE.clear()
 
-def _load_module(name: str, file_path: Path, is_package: bool = False):
+
+def _load_module(name: str, file_path: str, is_package: bool = False):
     """
     Dynamically load a Python module from a file path.
 
     Modules are registered under screenshot_tool_hooks.{name} to avoid
-    polluting sys.modules with bare names like "_default".
+    polluting sys.modules with bare names like "_default". A hook module
+    is executed once per version of its file: later calls (from run_all()
+    or another lifecycle point) cost one stat() and return the loaded
+    module unless the file's mtime or size changed. For packages only
+    __init__.py is checked.
     """
     qualified_name = f"screenshot_tool_hooks.{name}"
 
+    # Archived hooks are submodules of this (zipimported) package; the
+    # archive can't change under a running process, so sys.modules suffices
+    if _ARCHIVE and file_path.startswith(_ARCHIVE):
+        return importlib.import_module(qualified_name)
+
+    # Follows symlinks so an edited hooks.local link target is picked up
+    st = os.stat(file_path)
+    key = (file_path, st.st_mtime_ns, st.st_size)
+    module = _MODULE_CACHE.get(key)
+    if module is not None:
+        return module
+
+    stale = [k for k in _MODULE_CACHE if k[0] == file_path]
+    if stale:
+        for k in stale:
+            del _MODULE_CACHE[k]
+        sys.modules.pop(qualified_name, None)
+    else:
+        existing = sys.modules.get(qualified_name)
+        if existing is not None:
+            _MODULE_CACHE[key] = existing
+            return existing
+
     if is_package:
         spec = importlib.util.spec_from_file_location(
             qualified_name,
             file_path,
-            submodule_search_locations=[str(file_path.parent)]
+            submodule_search_locations=[os.path.dirname(file_path)]
         )
     else:
         spec = importlib.util.spec_from_file_location(qualified_name, file_path)
 
     module = importlib.util.module_from_spec(spec)
     sys.modules[qualified_name] = module
-    spec.loader.exec_module(module)
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Don't leave a half-initialized module behind for the next lookup
+        sys.modules.pop(qualified_name, None)
+        raise
+    _MODULE_CACHE[key] = module
     return module
 
 
-def _get_hooks() -> list[tuple[str, Path, bool]]:
+def _scan_hook_dir(hook_dir: Path) -> dict[str, HookEntry]:
+    """Find hooks in one directory with a single os.scandir() pass.
+
+    DirEntry caches the file type from readdir, so regular entries cost no
+    extra stat(); only symlinks and package __init__.py checks do.
+    """
+    files: dict[str, HookEntry] = {}
+    packages: dict[str, HookEntry] = {}
+
+    try:
+        it = os.scandir(hook_dir)
+    except OSError:
+        return {}
+
+    with it:
+        for entry in it:
+            name = entry.name
+            # Skip __init__.py, __pycache__, etc.
+            if name.startswith("__"):
+                continue
+
+            # Single-file hooks (*.py)
+            if name.endswith(".py") and entry.is_file():
+                stem = name[:-3]
+                files[stem] = (stem, entry.path, False)
+
+            # Hook packages (folders with __init__.py)
+            elif entry.is_dir():
+                init_file = os.path.join(entry.path, "__init__.py")
+                if os.path.isfile(init_file):
+                    packages[name] = (name, init_file, True)
+
+    # A package shadows a same-named single-file hook
+    files.update(packages)
+    return files
+
+
+def _scan_archive(archive: str) -> dict[str, HookEntry]:
+    """Find hooks inside hooks.pyz from the zip directory (no per-file stat)."""
+    import zipfile
+
+    files: dict[str, HookEntry] = {}
+    packages: dict[str, HookEntry] = {}
+
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            names = zf.namelist()
+    except (OSError, zipfile.BadZipFile) as e:
+        log.error("Could not read hook archive %s: %s", archive, e)
+        return {}
+
+    for arcname in names:
+        if not arcname.startswith(_ARCHIVE_PREFIX):
+            continue
+        parts = arcname[len(_ARCHIVE_PREFIX):].split("/")
+        if parts[0].startswith("__"):
+            continue
+        if len(parts) == 1 and parts[0].endswith(".py"):
+            stem = parts[0][:-3]
+            files[stem] = (stem, f"{archive}/{arcname}", False)
+        elif len(parts) == 2 and parts[1] == "__init__.py":
+            packages[parts[0]] = (parts[0], f"{archive}/{arcname}", True)
+
+    files.update(packages)
+    return files
+
+
+# ─────────────────────────────────────────────────────────────
+# Persistent hook index (opt-in: SCREENSHOT_TOOL_HOOK_CACHE=1)
+# ─────────────────────────────────────────────────────────────
+
+def _hook_index_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "screenshot-tool" / "hooks.index"
+
+
+def _hook_dir_mtimes() -> dict[str, Optional[int]]:
+    mtimes: dict[str, Optional[int]] = {}
+    for hook_dir in _hook_dirs():
+        try:
+            mtimes[str(hook_dir)] = os.stat(hook_dir).st_mtime_ns
+        except OSError:
+            mtimes[str(hook_dir)] = None
+    return mtimes
+
+
+def _load_cached_hooks(mtimes: dict[str, Optional[int]]) -> Optional[list[HookEntry]]:
+    """Return the indexed hook list if no hook directory changed since."""
+    try:
+        with open(_hook_index_path(), "rb") as f:
+            index = json.load(f)
+        if index.get("dirs") != mtimes:
+            return None
+        return [(name, path, bool(is_package)) for name, path, is_package in index["hooks"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_hooks(mtimes: dict[str, Optional[int]], hooks: list[HookEntry]) -> None:
+    index_path = _hook_index_path()
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps({"dirs": mtimes, "hooks": hooks}))
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        log.debug("Could not write hook index %s: %s", index_path, e)
+
+
+def _get_hooks() -> list[HookEntry]:
     """
     Find all hooks (single files and packages) sorted alphabetically.
 
+    The scan runs once per process; call invalidate_hook_cache() to rescan.
+    With SCREENSHOT_TOOL_HOOK_CACHE=1 the result is also persisted to
+    hooks.index in the user cache dir and reused by later processes until
+    the mtime of a hook directory changes (i.e. a hook is added, removed
+    or renamed). Archived hooks are never indexed.
+
     Returns:
         List of (hook_name, hook_file_path, is_package) tuples
     """
-    hooks_by_name: dict[str, tuple[str, Path, bool]] = {}
-
+    global _HOOKS_CACHE
+    if _HOOKS_CACHE is not None:
+        return _HOOKS_CACHE
+
+    use_index = not _ARCHIVE and os.environ.get("SCREENSHOT_TOOL_HOOK_CACHE") == "1"
+    if use_index:
+        mtimes = _hook_dir_mtimes()
+        cached = _load_cached_hooks(mtimes)
+        if cached is not None:
+            _HOOKS_CACHE = cached
+            return _HOOKS_CACHE
+
+    hooks_by_name: dict[str, HookEntry] = {}
     for hook_dir in _hook_dirs():
-        if not hook_dir.exists() or not hook_dir.is_dir():
-            continue
+        if _ARCHIVE and hook_dir == HOOKS_DIR:
+            hooks_by_name.update(_scan_archive(_ARCHIVE))
+        else:
+            hooks_by_name.update(_scan_hook_dir(hook_dir))
 
-        # Find single-file hooks (*.py, skip __*.py like __init__.py)
-        for hook_file in hook_dir.glob("*.py"):
-            if hook_file.name.startswith("__"):
-                continue
-            hooks_by_name[hook_file.stem] = (hook_file.stem, hook_file, False)
+    _HOOKS_CACHE = sorted(hooks_by_name.values(), key=lambda x: x[0])
+    if use_index:
+        _save_cached_hooks(mtimes, _HOOKS_CACHE)
+    return _HOOKS_CACHE
+
+
+def _extract(hook_name: str, module: ModuleType, folder_path: Path, data: dict) -> Optional[dict]:
+    """Call one hook's extract(), logging (not raising) on failure."""
+    try:
+        result = module.extract(folder_path, data)
+    except Exception as e:
+        log.error("Hook '%s' failed: %s", hook_name, e)
+        return None
+    return result if result and isinstance(result, dict) else None
+
+
+def _merge(hook_name: str, result: Optional[dict], current_data: dict) -> None:
+    if result:
+        current_data.update(result)
+        log.debug("Hook '%s': added %s", hook_name, list(result.keys()))
 
-        # Find hook packages (folders with __init__.py)
-        for item in hook_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("__"):
-                init_file = item / "__init__.py"
-                if init_file.exists():
-                    hooks_by_name[item.name] = (item.name, init_file, True)
 
-    return sorted(hooks_by_name.values(), key=lambda x: x[0])
+def _run_parallel(batch: list[tuple[str, ModuleType]], folder_path: Path, current_data: dict) -> None:
+    """Run a batch of parallel-safe hooks concurrently, merging in order."""
+    if len(batch) == 1:
+        hook_name, module = batch[0]
+        _merge(hook_name, _extract(hook_name, module, folder_path, current_data), current_data)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(batch))) as pool:
+        futures = [
+            (hook_name, pool.submit(_extract, hook_name, module, folder_path, dict(current_data)))
+            for hook_name, module in batch
+        ]
+        for hook_name, future in futures:
+            _merge(hook_name, future.result(), current_data)
 
 
 def run_all(folder_path: Path, current_data: dict) -> dict:
@@ -95,19 +314,35 @@ def run_all(folder_path: Path, current_data: dict) -> dict:
     Hooks are loaded in alphabetical order. Each hook's extract() function
     is called with the folder path and current data. Results are merged
     into current_data (later hooks can override earlier values).
+
+    Consecutive hooks that set a module-level `parallel = True` (e.g.
+    I/O-bound EXIF/OCR lookups) run concurrently on a snapshot of
+    current_data; their results are still merged in alphabetical order.
+    Hooks without the flag run one at a time and see every earlier result.
     """
+    batch: list[tuple[str, ModuleType]] = []
+
     for hook_name, hook_file, is_package in _get_hooks():
         try:
             module = _load_module(hook_name, hook_file, is_package)
-
-            if hasattr(module, "extract"):
-                result = module.extract(folder_path, current_data)
-                if result and isinstance(result, dict):
-                    current_data.update(result)
-                    log.debug("Hook '%s': added %s", hook_name, list(result.keys()))
-
         except Exception as e:
             log.error("Hook '%s' failed: %s", hook_name, e)
+            continue
+
+        if not hasattr(module, "extract"):
+            continue
+
+        if getattr(module, "parallel", False) is True:
+            batch.append((hook_name, module))
+            continue
+
+        if batch:
+            _run_parallel(batch, folder_path, current_data)
+            batch = []
+        _merge(hook_name, _extract(hook_name, module, folder_path, current_data), current_data)
+
+    if batch:
+        _run_parallel(batch, folder_path, current_data)
 
     return current_data
 
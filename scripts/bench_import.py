@@ -0,0 +1,108 @@
+"""Measure CLI startup cost to catch import-time regressions.
+
+Usage:
+    python scripts/bench_import.py [--runs N] [--max-ms MS]
+
+Runs `python -m screenshot_tool <flag>` for the fast-path flags in fresh
+interpreters, reports the median wall time, and lists any heavy module
+that leaked into the fast path. Exits non-zero if a heavy module was
+imported or the median exceeds --max-ms.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FAST_FLAGS = ["--version", "--print-lifecycle", "--print-hook-contract", "--print-config-schema"]
+
+# Modules that must not be imported on the fast path
+HEAVY_MODULES = [
+    "argparse",
+    "gi",
+    "yaml",
+    "screenshot_tool.capture",
+    "screenshot_tool.instance",
+    "screenshot_tool.output",
+    "screenshot_tool.wayfire",
+    "screenshot_tool_hooks",
+]
+
+_PROBE = """
+import contextlib, io, sys
+from screenshot_tool.cli import main
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        main([{flag!r}])
+    except SystemExit:
+        pass
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    env.pop("SCREENSHOT_TOOL_EAGER_IMPORT", None)
+    return env
+
+
+def _time_flag(flag: str, runs: int, env: dict) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "screenshot_tool", flag],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _leaked_modules(flag: str, env: dict) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(flag=flag, heavy=HEAVY_MODULES)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"probe for {flag} failed:\n{result.stderr.strip()}")
+    lines = result.stdout.strip().splitlines()
+    return [m for m in lines[-1].split(",") if m] if lines else []
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per flag (default: 10)")
+    parser.add_argument("--max-ms", type=float, help="Fail if any median exceeds this")
+    args = parser.parse_args()
+
+    env = _env()
+    failed = False
+    for flag in FAST_FLAGS:
+        median = _time_flag(flag, args.runs, env)
+        try:
+            leaked = _leaked_modules(flag, env)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            failed = True
+            continue
+        print(f"{flag:<22} median {median:7.1f} ms  leaked: {', '.join(leaked) or '-'}")
+        if leaked or (args.max_ms is not None and median > args.max_ms):
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
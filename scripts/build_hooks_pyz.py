@@ -0,0 +1,72 @@
+"""Pack the hooks/ directory into hooks.pyz for faster startup.
+
+Usage:
+    python scripts/build_hooks_pyz.py [OUTPUT]
+
+The CLI imports screenshot_tool_hooks from hooks.pyz (next to hooks/)
+whenever it exists, reading one zip directory instead of stat()ing every
+hook file. The archive is never checked against hooks/, so re-run (or
+delete hooks.pyz) after editing a hook; hooks.local/ is never packed and
+is always read from disk.
+
+Each module is stored as source plus bytecode for the running
+interpreter; other Python versions fall back to the source.
+"""
+
+import os
+import py_compile
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HOOKS_DIR = ROOT / "hooks"
+PACKAGE = "screenshot_tool_hooks"
+
+
+def _sources(hooks_dir: Path):
+    """Yield (source_path, archive_name) for every module under hooks_dir."""
+    for dirpath, dirnames, filenames in os.walk(hooks_dir):
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if d != "__pycache__" and (Path(dirpath, d) / "__init__.py").is_file()
+        )
+        rel = Path(dirpath).relative_to(hooks_dir)
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                yield Path(dirpath, filename), "/".join((PACKAGE, *rel.parts, filename))
+
+
+def build(output: Path) -> int:
+    tmp_output = output.with_suffix(output.suffix + ".tmp")
+    count = 0
+    with tempfile.TemporaryDirectory() as tmp, \
+            zipfile.ZipFile(tmp_output, "w", zipfile.ZIP_DEFLATED) as zf:
+        for source, arcname in _sources(HOOKS_DIR):
+            zf.write(source, arcname)
+            cfile = py_compile.compile(
+                str(source),
+                cfile=os.path.join(tmp, f"{count}.pyc"),
+                dfile=arcname,
+                doraise=True,
+            )
+            zf.write(cfile, arcname + "c")
+            count += 1
+    os.replace(tmp_output, output)
+    return count
+
+
+def main() -> int:
+    output = Path(sys.argv[1]) if len(sys.argv) > 1 else ROOT / "hooks.pyz"
+    try:
+        count = build(output)
+    except (OSError, py_compile.PyCompileError) as e:
+        print(f"Failed to build {output}: {e}", file=sys.stderr)
+        return 1
+    print(f"Packed {count} module(s) into {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Regenerate src/screenshot_tool/_introspection_json.py.
+
+Usage:
+    python scripts/gen_introspection.py [--check]
+
+Serializes the release-constant introspection payloads (hook contract,
+event catalog, lifecycle points and config schema) into bytes literals,
+so the matching CLI flags write them out without importing json or
+config. Re-run after changing _introspection.py or config_schema();
+--check exits non-zero if the generated module is out of date.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from screenshot_tool import _introspection  # noqa: E402
+from screenshot_tool.config import config_schema  # noqa: E402
+
+OUTPUT = ROOT / "src" / "screenshot_tool" / "_introspection_json.py"
+
+HEADER = '''"""Pre-serialized introspection payloads.
+
+Generated by scripts/gen_introspection.py from _introspection.py and
+config.config_schema(); do not edit by hand.
+"""
+'''
+
+
+def _dump(payload: dict) -> bytes:
+    return (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode()
+
+
+def render() -> str:
+    payloads = {
+        "HOOK_CONTRACT": _introspection.HOOK_CONTRACT,
+        "EVENT_CATALOG": _introspection.EVENT_CATALOG,
+        "LIFECYCLE": _introspection.LIFECYCLE,
+        "CONFIG_SCHEMA": config_schema(),
+    }
+    lines = [HEADER]
+    for name, payload in payloads.items():
+        lines.append(f"{name} = {_dump(payload)!r}\n")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="Fail if the output is stale")
+    args = parser.parse_args()
+
+    content = render()
+    if args.check:
+        current = OUTPUT.read_text() if OUTPUT.exists() else ""
+        if current != content:
+            print(f"{OUTPUT} is out of date; run {Path(__file__).name}", file=sys.stderr)
+            return 1
+        return 0
+
+    OUTPUT.write_text(content)
+    print(f"Wrote {OUTPUT}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,34 @@ A screenshot utility with:
 - Magnifier for pixel-perfect positioning
 - Double-tap for instant fullscreen capture
 - CLI and hotkey interfaces
+
+Submodules are resolved lazily on first attribute access so that
+short-circuiting CLI paths (--version, --help, introspection) do not pay
+for GTK/capture imports. Set SCREENSHOT_TOOL_EAGER_IMPORT=1 to resolve
+everything up front (useful in CI to surface import errors early).
 """
 
+import importlib
+import os
+
 __version__ = "2.0.0"
 __author__ = "Ckrest"
+
+_LAZY_SUBMODULES = ("capture", "config", "instance", "output", "wayfire")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
+
+
+if os.environ.get("SCREENSHOT_TOOL_EAGER_IMPORT"):
+    for _name in _LAZY_SUBMODULES:
+        __getattr__(_name)
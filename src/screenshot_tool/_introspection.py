@@ -0,0 +1,57 @@
+"""Static payloads for the CLI introspection flags.
+
+The source of truth for _introspection_json.py, which
+scripts/gen_introspection.py regenerates from these dicts; the CLI only
+ever imports the pre-serialized module.
+"""
+
+HOOK_CONTRACT = {
+    "events": [
+        {
+            "name": "on_save",
+            "args": ["output_path", "width", "height", "timestamp"],
+            "description": "Called after a screenshot is saved",
+        }
+    ]
+}
+
+EVENT_CATALOG = {
+    "catalog": [
+        {
+            "event_type": "config.resolved",
+            "lifecycle_point": "config.loaded",
+            "data_fields": ["config_path", "source"],
+        },
+        {
+            "event_type": "operation.started",
+            "lifecycle_point": "operation.started",
+            "data_fields": ["operation_type", "operation_id", "mode", "monitor"],
+        },
+        {
+            "event_type": "operation.completed",
+            "lifecycle_point": "artifact.created",
+            "data_fields": ["operation_type", "operation_id", "outputs", "metadata", "mode", "monitor"],
+        },
+        {
+            "event_type": "artifact.created",
+            "lifecycle_point": "artifact.created",
+            "data_fields": ["file_path", "file_type", "metadata"],
+        },
+        {
+            "event_type": "error.handled",
+            "lifecycle_point": "error.occurred",
+            "data_fields": ["error_type", "message", "mode"],
+        },
+    ]
+}
+
+LIFECYCLE = {
+    "points": [
+        "startup",
+        "config.loaded",
+        "operation.started",
+        "artifact.created",
+        "error.occurred",
+        "shutdown",
+    ]
+}
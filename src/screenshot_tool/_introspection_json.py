@@ -0,0 +1,13 @@
+"""Pre-serialized introspection payloads.
+
+Generated by scripts/gen_introspection.py from _introspection.py and
+config.config_schema(); do not edit by hand.
+"""
+
+HOOK_CONTRACT = b'{\n  "events": [\n    {\n      "args": [\n        "output_path",\n        "width",\n        "height",\n        "timestamp"\n      ],\n      "description": "Called after a screenshot is saved",\n      "name": "on_save"\n    }\n  ]\n}\n'
+
+EVENT_CATALOG = b'{\n  "catalog": [\n    {\n      "data_fields": [\n        "config_path",\n        "source"\n      ],\n      "event_type": "config.resolved",\n      "lifecycle_point": "config.loaded"\n    },\n    {\n      "data_fields": [\n        "operation_type",\n        "operation_id",\n        "mode",\n        "monitor"\n      ],\n      "event_type": "operation.started",\n      "lifecycle_point": "operation.started"\n    },\n    {\n      "data_fields": [\n        "operation_type",\n        "operation_id",\n        "outputs",\n        "metadata",\n        "mode",\n        "monitor"\n      ],\n      "event_type": "operation.completed",\n      "lifecycle_point": "artifact.created"\n    },\n    {\n      "data_fields": [\n        "file_path",\n        "file_type",\n        "metadata"\n      ],\n      "event_type": "artifact.created",\n      "lifecycle_point": "artifact.created"\n    },\n    {\n      "data_fields": [\n        "error_type",\n        "message",\n        "mode"\n      ],\n      "event_type": "error.handled",\n      "lifecycle_point": "error.occurred"\n    }\n  ]\n}\n'
+
+LIFECYCLE = b'{\n  "points": [\n    "startup",\n    "config.loaded",\n    "operation.started",\n    "artifact.created",\n    "error.occurred",\n    "shutdown"\n  ]\n}\n'
+
+CONFIG_SCHEMA = b'{\n  "$schema": "https://json-schema.org/draft/2020-12/schema",\n  "additionalProperties": false,\n  "properties": {\n    "cache_dir": {\n      "type": "string"\n    },\n    "data_dir": {\n      "type": "string"\n    },\n    "default_format": {\n      "enum": [\n        "jpeg",\n        "jpg",\n        "png",\n        "webp"\n      ],\n      "type": "string"\n    },\n    "default_quality": {\n      "maximum": 100,\n      "minimum": 1,\n      "type": "integer"\n    },\n    "double_tap_file": {\n      "type": "string"\n    },\n    "double_tap_ms": {\n      "minimum": 0,\n      "type": "integer"\n    },\n    "emit_progress_events": {\n      "type": "boolean"\n    },\n    "enable_clipboard": {\n      "type": "boolean"\n    },\n    "enable_notification": {\n      "type": "boolean"\n    },\n    "enable_sound": {\n      "type": "boolean"\n    },\n    "hooks_dir": {\n      "type": [\n        "string",\n        "null"\n      ]\n    },\n    "lock_file": {\n      "type": "string"\n    },\n    "output_dir": {\n      "type": "string"\n    },\n    "silent_output_dir": {\n      "type": "string"\n    },\n    "wayland_capture": {\n      "type": "string"\n    }\n  },\n  "type": "object"\n}\n'
@@ -1,18 +1,29 @@
 """Core screenshot capture functions.
 
 Uses wayland-capture binary for the actual screen capture.
-All functions return a temporary file path that must be handled by the caller.
+The *_bytes functions capture into an anonymous memfd (or a pipe where
+memfd_create is unavailable) and return the PNG in memory;
+fullscreen/region/window write it to a temporary file that must be
+handled by the caller.
 """
 
+import functools
 import json
 import logging
+import os
+import selectors
+import signal
 import subprocess
 import tempfile
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .config import Config, get_config
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 log = logging.getLogger(__name__)
 
 
@@ -21,6 +32,173 @@ class CaptureError(Exception):
     pass
 
 
+# Fixed argv tails, built once
+_LIST_ARGS = ("--list", "--json")
+
+# Python ignores these at startup and an ignored disposition survives exec;
+# reset them for wayland-capture as subprocess's restore_signals does
+_RESTORE_SIGNALS = (signal.SIGPIPE, signal.SIGXFSZ)
+
+
+def _spawn_and_wait(argv: list[str], timeout: float) -> tuple[int, bytes, bytes]:
+    """Run argv via os.posix_spawnp and collect its stdout and stderr.
+
+    Cheaper than subprocess.run on the capture hot path: no fork of the
+    interpreter and no close_fds scan; only stdout/stderr are remapped.
+
+    Returns:
+        (exit code, stdout bytes, stderr bytes)
+
+    Raises:
+        FileNotFoundError: If argv[0] cannot be found on PATH
+        subprocess.TimeoutExpired: If the child runs past timeout (it is killed)
+    """
+    out_r, out_w = os.pipe2(os.O_CLOEXEC)
+    err_r, err_w = os.pipe2(os.O_CLOEXEC)
+    try:
+        pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, out_w, 1),
+            (os.POSIX_SPAWN_DUP2, err_w, 2),
+        ], setsigdef=_RESTORE_SIGNALS)
+    except BaseException:
+        for fd in (out_r, out_w, err_r, err_w):
+            os.close(fd)
+        raise
+    os.close(out_w)
+    os.close(err_w)
+
+    chunks: dict[int, list[bytes]] = {out_r: [], err_r: []}
+    deadline = time.monotonic() + timeout
+    try:
+        with selectors.DefaultSelector() as sel:
+            sel.register(out_r, selectors.EVENT_READ)
+            sel.register(err_r, selectors.EVENT_READ)
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                    raise subprocess.TimeoutExpired(argv, timeout)
+                for key, _ in sel.select(remaining):
+                    data = os.read(key.fd, 1 << 16)
+                    if data:
+                        chunks[key.fd].append(data)
+                    else:
+                        sel.unregister(key.fd)
+    finally:
+        os.close(out_r)
+        os.close(err_r)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), b"".join(chunks[out_r]), b"".join(chunks[err_r])
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_binary(name: str, search_path: str, cache_dir: str) -> str:
+    """Resolve a bare binary name to an absolute path, once per PATH.
+
+    The result is kept in <cache_dir>/binary_path keyed by a hash of
+    PATH, so later runs skip the PATH walk while the entry is still
+    executable. Names containing a slash, and names that can't be found,
+    are returned unchanged (posix_spawnp then reports the failure).
+    """
+    if "/" in name:
+        return name
+
+    import hashlib
+
+    path_hash = hashlib.blake2b(search_path.encode(), digest_size=8).hexdigest()
+    cache_file = os.path.join(cache_dir, "binary_path")
+    try:
+        with open(cache_file, "rb") as f:
+            cached = json.load(f)
+        found = cached["path"]
+        if cached["name"] == name and cached["path_hash"] == path_hash and os.access(found, os.X_OK):
+            return found
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    import shutil
+
+    found = shutil.which(name, path=search_path)
+    if found is None:
+        return name
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"name": name, "path_hash": path_hash, "path": found}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        log.debug("Could not cache binary path: %s", e)
+    return found
+
+
+def _binary(config: Config) -> str:
+    """wayland-capture as an absolute path where it can be resolved."""
+    return _resolve_binary(
+        config.wayland_capture, os.environ.get("PATH", os.defpath), str(config.cache_dir),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _list_all(wayland_capture: str) -> dict:
+    """Run `wayland-capture --list --json` once and cache the parsed result.
+
+    The cache spans one CLI invocation; long-lived callers (the overlay)
+    call invalidate_list_cache() before each selection. Failures raise
+    (and so are not cached); callers log and degrade.
+    """
+    returncode, stdout, stderr = _spawn_and_wait([wayland_capture, *_LIST_ARGS], timeout=5)
+    if returncode != 0:
+        raise CaptureError(f"wayland-capture --list failed: {stderr.decode(errors='replace')}")
+    data = json.loads(stdout.decode())
+    return data if isinstance(data, dict) else {}
+
+
+def invalidate_list_cache() -> None:
+    """Forget cached output/window lists (e.g., after a monitor hotplug)."""
+    global _pending_list
+    _pending_list = None
+    _list_all.cache_clear()
+
+
+# In-flight background `--list` probe started by prefetch_outputs()
+_pending_list: Optional["Future"] = None
+
+
+def prefetch_outputs(config: Optional[Config] = None) -> None:
+    """Start the `wayland-capture --list` probe in a background thread.
+
+    Lets the probe overlap other startup work (capture delay, argv and
+    memfd setup); the next get_primary_output()/list_outputs() call then
+    waits for it instead of spawning its own. A no-op if a probe is
+    already pending or a list is already cached.
+    """
+    global _pending_list
+    if _pending_list is not None or _list_all.cache_info().currsize:
+        return
+    config = config or get_config()
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wayland-capture-list")
+    _pending_list = executor.submit(_list_all, _binary(config))
+    executor.shutdown(wait=False)
+
+
+def _get_list(config: Config) -> dict:
+    global _pending_list
+    pending, _pending_list = _pending_list, None
+    if pending is not None:
+        try:
+            pending.result(timeout=5)
+        except Exception:
+            # Not cached on failure; the call below retries and raises
+            pass
+    return _list_all(_binary(config))
+
+
 def get_primary_output(config: Optional[Config] = None) -> Optional[str]:
     """Get the primary output name from wayland-capture.
 
@@ -29,17 +207,9 @@ def get_primary_output(config: Optional[Config] = None) -> Optional[str]:
     """
     config = config or get_config()
     try:
-        result = subprocess.run(
-            [config.wayland_capture, "--list", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            outputs = data.get("outputs", [])
-            if outputs:
-                return outputs[0].get("name")
+        outputs = _get_list(config).get("outputs", [])
+        if outputs:
+            return outputs[0].get("name")
     except Exception as e:
         log.warning("Could not get output list: %s", e)
     return None
@@ -53,15 +223,7 @@ def list_outputs(config: Optional[Config] = None) -> list[dict]:
     """
     config = config or get_config()
     try:
-        result = subprocess.run(
-            [config.wayland_capture, "--list", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            return data.get("outputs", [])
+        return list(_get_list(config).get("outputs", []))
     except Exception as e:
         log.warning("Could not list outputs: %s", e)
     return []
@@ -75,78 +237,115 @@ def list_windows(config: Optional[Config] = None) -> list[dict]:
     """
     config = config or get_config()
     try:
-        result = subprocess.run(
-            [config.wayland_capture, "--list", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            return data.get("windows", [])
+        return list(_get_list(config).get("windows", []))
     except Exception as e:
         log.warning("Could not list windows: %s", e)
     return []
 
 
-def fullscreen(
+def _open_memfd() -> Optional[int]:
+    """Create an anonymous in-memory file, or None if unsupported."""
+    try:
+        return os.memfd_create("screenshot", os.MFD_CLOEXEC)
+    except (AttributeError, OSError):
+        return None
+
+
+def _run_capture(argv: list[str], what: str) -> bytes:
+    """Run wayland-capture and return the captured PNG without touching disk.
+
+    The PNG is written into a memfd that wayland-capture opens through
+    /proc/<pid>/fd/<n>, so no dentry is created and the image is read back
+    in one pass. Without memfd support it is streamed over stdout instead.
+
+    Args:
+        argv: wayland-capture command line, without --output-file
+        what: Human-readable capture kind for error messages
+
+    Returns:
+        Encoded PNG bytes
+
+    Raises:
+        CaptureError: If capture fails
+    """
+    memfd = _open_memfd()
+    target = f"/proc/{os.getpid()}/fd/{memfd}" if memfd is not None else "-"
+    try:
+        try:
+            returncode, stdout, stderr = _spawn_and_wait(
+                [*argv, "--output-file", target], timeout=10,
+            )
+        except subprocess.TimeoutExpired:
+            raise CaptureError(f"{what} timed out")
+        except FileNotFoundError:
+            raise CaptureError(f"wayland-capture not found: {argv[0]}")
+
+        if memfd is not None:
+            # Our descriptor's offset is still 0; the child wrote via its own open
+            with os.fdopen(memfd, "rb", closefd=False) as f:
+                png = f.read()
+        else:
+            png = stdout
+    finally:
+        if memfd is not None:
+            os.close(memfd)
+
+    if returncode != 0 or not png:
+        raise CaptureError(f"{what} failed: {stderr.decode(errors='replace')}")
+
+    return png
+
+
+def save_to_tempfile(png_bytes: bytes) -> Path:
+    """Write captured PNG bytes to a temporary file.
+
+    For callers that need a filesystem path rather than in-memory bytes.
+
+    Returns:
+        Path to temporary PNG file (caller must delete it)
+    """
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+        tmp.write(png_bytes)
+    return Path(tmp.name)
+
+
+def fullscreen_bytes(
     monitor: Optional[str] = None,
     config: Optional[Config] = None,
-) -> Path:
-    """Capture full screen (or specific monitor).
+) -> bytes:
+    """Capture full screen (or specific monitor) into memory.
 
     Args:
         monitor: Output name (e.g., 'eDP-1'). If None, uses primary.
         config: Configuration object. If None, uses global config.
 
     Returns:
-        Path to temporary PNG file
+        Encoded PNG bytes
 
     Raises:
         CaptureError: If capture fails
     """
     config = config or get_config()
 
-    # Create temp file
-    tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    temp_path = Path(tmp.name)
-    tmp.close()
-
     # Get output name if not specified
     output_name = monitor or get_primary_output(config)
     if not output_name:
         raise CaptureError("Could not determine output to capture")
 
-    try:
-        result = subprocess.run(
-            [config.wayland_capture, "--output", output_name, "--output-file", str(temp_path)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if result.returncode != 0:
-            temp_path.unlink(missing_ok=True)
-            raise CaptureError(f"Screen capture failed: {result.stderr}")
+    return _run_capture(
+        [_binary(config), "--output", output_name],
+        "Screen capture",
+    )
 
-        return temp_path
 
-    except subprocess.TimeoutExpired:
-        temp_path.unlink(missing_ok=True)
-        raise CaptureError("Screen capture timed out")
-    except FileNotFoundError:
-        temp_path.unlink(missing_ok=True)
-        raise CaptureError(f"wayland-capture not found: {config.wayland_capture}")
-
-
-def region(
+def region_bytes(
     x: int,
     y: int,
     width: int,
     height: int,
     config: Optional[Config] = None,
-) -> Path:
-    """Capture a specific region of the screen.
+) -> bytes:
+    """Capture a specific region of the screen into memory.
 
     Args:
         x: X coordinate of top-left corner
@@ -156,84 +355,94 @@ def region(
         config: Configuration object. If None, uses global config.
 
     Returns:
-        Path to temporary PNG file
+        Encoded PNG bytes
 
     Raises:
         CaptureError: If capture fails
     """
     config = config or get_config()
 
-    # Create temp file
-    tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    temp_path = Path(tmp.name)
-    tmp.close()
-
     # Get primary output for region capture
     output_name = get_primary_output(config)
     if not output_name:
         raise CaptureError("Could not determine output to capture")
 
-    try:
-        result = subprocess.run(
-            [
-                config.wayland_capture,
-                "--output", output_name,
-                "--region", f"{x},{y},{width},{height}",
-                "--output-file", str(temp_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if result.returncode != 0:
-            temp_path.unlink(missing_ok=True)
-            raise CaptureError(f"Region capture failed: {result.stderr}")
+    return _run_capture(
+        [
+            _binary(config),
+            "--output", output_name,
+            "--region", f"{x},{y},{width},{height}",
+        ],
+        "Region capture",
+    )
 
-        return temp_path
 
-    except subprocess.TimeoutExpired:
-        temp_path.unlink(missing_ok=True)
-        raise CaptureError("Region capture timed out")
-
-
-def window(
+def window_bytes(
     app_id: str,
     config: Optional[Config] = None,
-) -> Path:
-    """Capture a specific window by app-id.
+) -> bytes:
+    """Capture a specific window by app-id into memory.
 
     Args:
         app_id: The Wayland app-id (e.g., 'kitty', 'brave-browser')
         config: Configuration object. If None, uses global config.
 
     Returns:
-        Path to temporary PNG file
+        Encoded PNG bytes
 
     Raises:
         CaptureError: If capture fails
     """
     config = config or get_config()
+    return _run_capture(
+        [_binary(config), "--window", app_id],
+        "Window capture",
+    )
 
-    # Create temp file
-    tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    temp_path = Path(tmp.name)
-    tmp.close()
 
-    try:
-        result = subprocess.run(
-            [config.wayland_capture, "--window", app_id, "--output-file", str(temp_path)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if result.returncode != 0:
-            temp_path.unlink(missing_ok=True)
-            raise CaptureError(f"Window capture failed: {result.stderr}")
-
-        return temp_path
-
-    except subprocess.TimeoutExpired:
-        temp_path.unlink(missing_ok=True)
-        raise CaptureError("Window capture timed out")
+def fullscreen(
+    monitor: Optional[str] = None,
+    config: Optional[Config] = None,
+) -> Path:
+    """Capture full screen (or specific monitor) to a temporary file.
+
+    Returns:
+        Path to temporary PNG file
+
+    Raises:
+        CaptureError: If capture fails
+    """
+    return save_to_tempfile(fullscreen_bytes(monitor=monitor, config=config))
+
+
+def region(
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    config: Optional[Config] = None,
+) -> Path:
+    """Capture a specific region of the screen to a temporary file.
+
+    Returns:
+        Path to temporary PNG file
+
+    Raises:
+        CaptureError: If capture fails
+    """
+    return save_to_tempfile(region_bytes(x, y, width, height, config=config))
+
+
+def window(
+    app_id: str,
+    config: Optional[Config] = None,
+) -> Path:
+    """Capture a specific window by app-id to a temporary file.
+
+    Returns:
+        Path to temporary PNG file
+
+    Raises:
+        CaptureError: If capture fails
+    """
+    return save_to_tempfile(window_bytes(app_id, config=config))
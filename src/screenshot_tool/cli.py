@@ -6,45 +6,134 @@ Entry point flow:
 3. Route to appropriate mode: instant, region, window, or interactive
 """
 
-import argparse
 import atexit
-import json
 import logging
+import os
+import re
 import sys
-import time
-import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from . import __version__
-from .config import (
-    Config,
-    config_defaults,
-    config_schema,
-    config_to_dict,
-    load_config,
-    validate_config_file,
-)
-from .emit import emit, configure
-from .instance import InstanceManager
+from .emit import emit
+
+if TYPE_CHECKING:
+    import argparse
+    from types import SimpleNamespace
 
-# Bootstrap hooks package from package root hooks/ directory
-import importlib.util as _ilu
+    from .config import Config
+    from .instance import InstanceManager
+    from .output import OutputOptions, OutputResult
+
+# Package root hooks/ directory, bootstrapped by _bootstrap_hooks()
 _hooks_dir = Path(__file__).parent.parent.parent / "hooks"
-if _hooks_dir.is_dir() and (_hooks_dir / "__init__.py").exists():
-    _spec = _ilu.spec_from_file_location(
+# Optional prebuilt archive of hooks/ (scripts/build_hooks_pyz.py)
+_hooks_pyz = _hooks_dir.parent / "hooks.pyz"
+
+log = logging.getLogger(__name__)
+
+# --region X,Y,W,H; x/y may be negative on multi-monitor layouts, and the
+# whitespace int() used to tolerate is still accepted
+_REGION_RE = re.compile(
+    r"\s*([+-]?\d+)\s*,\s*([+-]?\d+)\s*,\s*(\+?\d+)\s*,\s*(\+?\d+)\s*"
+)
+
+
+# Always shipped in hooks/ and has no lifecycle functions, so it alone
+# never warrants bootstrapping the hooks package
+_BUNDLED_HOOK = "_default.py"
+
+
+def _archive_has_hooks() -> bool:
+    """Check hooks.pyz's zip directory for a hook besides the bundled one."""
+    import zipfile
+
+    prefix = "screenshot_tool_hooks/"
+    try:
+        with zipfile.ZipFile(_hooks_pyz) as zf:
+            names = zf.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return False
+    for arcname in names:
+        if not arcname.startswith(prefix):
+            continue
+        parts = arcname[len(prefix):].split("/")
+        name = parts[0]
+        if name.startswith("__") or name == _BUNDLED_HOOK:
+            continue
+        if len(parts) == 1 and name.endswith(".py"):
+            return True
+        if len(parts) == 2 and parts[1] == "__init__.py":
+            return True
+    return False
+
+
+def _has_hooks() -> bool:
+    """Cheaply check whether any hook module is installed.
+
+    Stops at the first hook found, so the hooks package is only imported
+    (and its lifecycle run) when there is something for it to do. The
+    bundled hooks/_default.py does not count.
+    """
+    hook_dirs = [_hooks_dir, _hooks_dir.parent / "hooks.local"]
+    if _hooks_pyz.is_file():
+        # The archive stands in for hooks/; hooks.local/ is still on disk
+        if _archive_has_hooks():
+            return True
+        del hook_dirs[0]
+    for hook_dir in hook_dirs:
+        try:
+            with os.scandir(hook_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("__"):
+                        continue
+                    if name == _BUNDLED_HOOK and hook_dir is _hooks_dir:
+                        continue
+                    if name.endswith(".py"):
+                        if entry.is_file():
+                            return True
+                    elif entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                        return True
+        except OSError:
+            continue
+    return False
+
+
+def _bootstrap_hooks() -> None:
+    """Register the package root hooks/ directory as screenshot_tool_hooks."""
+    if "screenshot_tool_hooks" in sys.modules:
+        return
+
+    import importlib.util
+
+    # Prefer hooks.pyz whenever it exists. It is not checked against hooks/
+    # (that would stat every hook file again); whoever installs or edits
+    # hooks rebuilds it with scripts/build_hooks_pyz.py
+    if _hooks_pyz.is_file():
+        import zipimport
+        try:
+            spec = zipimport.zipimporter(str(_hooks_pyz)).find_spec("screenshot_tool_hooks")
+            if spec is not None:
+                hooks_mod = importlib.util.module_from_spec(spec)
+                sys.modules["screenshot_tool_hooks"] = hooks_mod
+                spec.loader.exec_module(hooks_mod)
+                return
+        except Exception as e:
+            sys.modules.pop("screenshot_tool_hooks", None)
+            log.debug("Ignoring unusable %s: %s", _hooks_pyz, e)
+
+    if not (_hooks_dir.is_dir() and (_hooks_dir / "__init__.py").exists()):
+        return
+
+    spec = importlib.util.spec_from_file_location(
         "screenshot_tool_hooks",
         _hooks_dir / "__init__.py",
         submodule_search_locations=[str(_hooks_dir)]
     )
-    _hooks_mod = _ilu.module_from_spec(_spec)
-    sys.modules["screenshot_tool_hooks"] = _hooks_mod
-    _spec.loader.exec_module(_hooks_mod)
-from .capture import fullscreen, region, window, CaptureError
-from .output import OutputOptions, OutputResult, save
-from .wayfire import hide_cursor, show_cursor
-
-log = logging.getLogger(__name__)
+    hooks_mod = importlib.util.module_from_spec(spec)
+    sys.modules["screenshot_tool_hooks"] = hooks_mod
+    spec.loader.exec_module(hooks_mod)
 
 
 def _operation_type() -> str:
@@ -52,13 +141,19 @@ def _operation_type() -> str:
 
 
 def _start_operation(mode: str, monitor: Optional[str]) -> str:
-    operation_id = str(uuid.uuid4())
-    emit("operation.started", {
-        "operation_type": _operation_type(),
-        "operation_id": operation_id,
-        "mode": mode,
-        "monitor": monitor,
-    })
+    import uuid
+    from .config import get_config
+
+    operation_id = uuid.uuid4().hex
+    # operation.completed carries everything a one-shot consumer needs;
+    # the started event is only useful to real-time progress observers.
+    if get_config().emit_progress_events:
+        emit("operation.started", {
+            "operation_type": _operation_type(),
+            "operation_id": operation_id,
+            "mode": mode,
+            "monitor": monitor,
+        })
     return operation_id
 
 
@@ -66,7 +161,7 @@ def _complete_operation(
     operation_id: str,
     mode: str,
     monitor: Optional[str],
-    result: Optional[OutputResult] = None,
+    result: Optional["OutputResult"] = None,
     error_message: Optional[str] = None,
 ) -> None:
     payload = {
@@ -93,8 +188,53 @@ def _complete_operation(
     emit("operation.completed", payload)
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
-    """Create comprehensive argument parser for CLI usage."""
+# Option strings understood without _add_output_args(); anything else on
+# the command line (including -h/--help) needs the full parser.
+_CORE_FLAGS = frozenset({
+    "--version", "--config", "--debug",
+    "--print-defaults", "--print-config-schema", "--validate-config",
+    "--print-hook-contract", "--print-resolved", "--print-event-catalog",
+    "--print-lifecycle",
+    "--instant", "--region", "--window",
+})
+
+# Values of the _add_output_args() options when they are not registered
+_OUTPUT_ARG_DEFAULTS = {
+    "output": None,
+    "format": "png",
+    "quality": 90,
+    "no_clipboard": False,
+    "no_notification": False,
+    "no_sound": False,
+    "silent": False,
+    "stdout": False,
+    "json": False,
+    "delay": None,
+    "monitor": None,
+}
+
+
+_FORMAT_CHOICES = ("png", "jpg", "jpeg", "webp")
+
+
+def _needs_output_args(argv: list[str]) -> bool:
+    """Check whether argv uses any flag outside _CORE_FLAGS."""
+    for token in argv:
+        if token.startswith("-") and token.split("=", 1)[0] not in _CORE_FLAGS:
+            return True
+    return False
+
+
+def create_argument_parser(output_args: bool = True) -> "argparse.ArgumentParser":
+    """Create comprehensive argument parser for CLI usage.
+
+    Args:
+        output_args: Register the output/behavior options. When False
+            they are skipped and their defaults set on the namespace, for
+            invocations that use none of them.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Screenshot Tool for Wayland/Wayfire",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -177,6 +317,23 @@ Examples:
         help="Capture window by app-id (e.g., kitty, brave-browser)",
     )
 
+    if output_args:
+        _add_output_args(parser)
+    else:
+        parser.set_defaults(**_OUTPUT_ARG_DEFAULTS)
+
+    # Debug
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging",
+    )
+
+    return parser
+
+
+def _add_output_args(parser: "argparse.ArgumentParser") -> None:
+    """Add output, behavior and timing options to parser."""
     # Output options
     parser.add_argument(
         "--output", "-o",
@@ -185,7 +342,7 @@ Examples:
     )
     parser.add_argument(
         "--format", "-f",
-        choices=["png", "jpg", "jpeg", "webp"],
+        choices=_FORMAT_CHOICES,
         default="png",
         help="Output format (default: png)",
     )
@@ -244,48 +401,213 @@ Examples:
         help="Capture specific monitor (e.g., eDP-1, HDMI-A-1)",
     )
 
-    # Debug
-    parser.add_argument(
-        "--debug",
-        action="store_true",
-        help="Enable debug logging",
-    )
 
-    return parser
+# Hand-rolled parsing for the common invocations (see _fast_parse)
+_FAST_STORE_TRUE = {
+    "--instant": "instant",
+    "--debug": "debug",
+    "--no-clipboard": "no_clipboard",
+    "--no-notification": "no_notification",
+    "--no-sound": "no_sound",
+    "--silent": "silent",
+    "--stdout": "stdout",
+    "--json": "json",
+    "--print-defaults": "print_defaults",
+    "--print-config-schema": "print_config_schema",
+    "--validate-config": "validate_config",
+    "--print-hook-contract": "print_hook_contract",
+    "--print-resolved": "print_resolved",
+    "--print-event-catalog": "print_event_catalog",
+    "--print-lifecycle": "print_lifecycle",
+}
+_FAST_VALUE = {
+    "--config": ("config", str),
+    "--region": ("region", str),
+    "--window": ("window", str),
+    "--output": ("output", str),
+    "-o": ("output", str),
+    "--format": ("format", str),
+    "-f": ("format", str),
+    "--quality": ("quality", int),
+    "-q": ("quality", int),
+    "--delay": ("delay", int),
+    "--monitor": ("monitor", str),
+}
+_FAST_DEFAULTS = {
+    **{dest: False for dest in _FAST_STORE_TRUE.values()},
+    "config": None,
+    "region": None,
+    "window": None,
+    **_OUTPUT_ARG_DEFAULTS,
+}
+
+
+def _fast_parse(argv: list[str]) -> "SimpleNamespace":
+    """Parse argv without argparse for plain, well-formed command lines.
+
+    Only exact flag spellings are recognised. Anything needing argparse
+    semantics (help, --version, abbreviations, bundled short flags,
+    invalid values, conflicting capture modes) raises so the caller can
+    fall back to the real parser and its error messages.
 
+    Returns:
+        Namespace with the same attributes as create_argument_parser()
 
-def build_output_options(args: argparse.Namespace) -> OutputOptions:
+    Raises:
+        KeyError: On an unknown flag
+        ValueError: On a missing or invalid value, or conflicting modes
+    """
+    from types import SimpleNamespace
+
+    values = dict(_FAST_DEFAULTS)
+    i, n = 0, len(argv)
+    while i < n:
+        token = argv[i]
+        i += 1
+        dest = _FAST_STORE_TRUE.get(token)
+        if dest is not None:
+            values[dest] = True
+            continue
+        flag, eq, value = token.partition("=")
+        if eq and not flag.startswith("--"):
+            # argparse reads "-o=x" as the value "=x"; leave it to argparse
+            raise KeyError(token)
+        dest, convert = _FAST_VALUE[flag]
+        if not eq:
+            if i >= n or argv[i].startswith("-"):
+                raise ValueError(f"{flag} expects a value")
+            value = argv[i]
+            i += 1
+        values[dest] = convert(value)
+
+    if values["format"] not in _FORMAT_CHOICES:
+        raise ValueError(f"invalid format: {values['format']}")
+    if values["instant"] + (values["region"] is not None) + (values["window"] is not None) > 1:
+        raise ValueError("capture modes are mutually exclusive")
+    return SimpleNamespace(**values)
+
+
+# Feedback-suppression bits for build_output_options()
+_SILENT = 1
+_NO_CLIPBOARD = 2
+_NO_NOTIFICATION = 4
+_NO_SOUND = 8
+
+
+def build_output_options(args: "argparse.Namespace") -> "OutputOptions":
     """Build OutputOptions from parsed arguments."""
+    from .output import OutputOptions
+
+    # Each feedback channel is off if its --no-* flag or --silent is set
+    mask = (
+        (_SILENT if args.silent else 0)
+        | (_NO_CLIPBOARD if args.no_clipboard else 0)
+        | (_NO_NOTIFICATION if args.no_notification else 0)
+        | (_NO_SOUND if args.no_sound else 0)
+    )
+    silent = bool(mask & _SILENT)
     return OutputOptions(
         output_path=Path(args.output) if args.output else None,
         output_format=args.format,
         quality=args.quality,
-        clipboard=not (args.no_clipboard or args.silent),
-        notification=not (args.no_notification or args.silent),
-        sound=not (args.no_sound or args.silent),
+        clipboard=not mask & (_SILENT | _NO_CLIPBOARD),
+        notification=not mask & (_SILENT | _NO_NOTIFICATION),
+        sound=not mask & (_SILENT | _NO_SOUND),
         stdout=args.stdout,
-        json_output=args.json or args.silent,
-        silent=args.silent,
+        json_output=args.json or silent,
+        silent=silent,
     )
 
 
+def _write_stdout_bytes(data: bytes) -> None:
+    """Write encoded (UTF-8) output, bypassing the text layer if possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Replaced stdout (e.g. io.StringIO in tests) has no byte layer
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+
+
 def _emit_json(payload: dict) -> None:
-    print(json.dumps(payload, indent=2, sort_keys=True))
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        print(json.dumps(payload, indent=2, sort_keys=True))
+        return
+
+    _write_stdout_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n")
+
+
+def _print_defaults() -> int:
+    from .config import config_defaults
+    _emit_json(config_defaults())
+    return 0
+
+
+def _write_static(payload: bytes) -> int:
+    _write_stdout_bytes(payload)
+    return 0
+
+
+def _print_config_schema() -> int:
+    from ._introspection_json import CONFIG_SCHEMA
+    return _write_static(CONFIG_SCHEMA)
+
+
+def _print_lifecycle() -> int:
+    from ._introspection_json import LIFECYCLE
+    return _write_static(LIFECYCLE)
+
+
+def _print_hook_contract() -> int:
+    from ._introspection_json import HOOK_CONTRACT
+    return _write_static(HOOK_CONTRACT)
 
 
-def _handle_introspection(args: argparse.Namespace) -> Optional[int]:
-    config_path = Path(args.config).expanduser() if args.config else None
+def _print_event_catalog() -> int:
+    from ._introspection_json import EVENT_CATALOG
+    return _write_static(EVENT_CATALOG)
 
+
+def _print_version() -> int:
+    # Same output as argparse's version action, which remains the fallback
+    print(f"screenshot-tool {__version__}")
+    return 0
+
+
+# Introspection flags that depend on no other argument; answered before
+# argparse is even imported when given on their own.
+_FAST_INTROSPECTION = {
+    "--version": _print_version,
+    "--print-defaults": _print_defaults,
+    "--print-config-schema": _print_config_schema,
+    "--print-hook-contract": _print_hook_contract,
+    "--print-event-catalog": _print_event_catalog,
+    "--print-lifecycle": _print_lifecycle,
+}
+
+
+def _config_path_arg(args: "argparse.Namespace") -> Optional[str]:
+    path = args.config
+    if not path:
+        return None
+    return os.path.expanduser(path) if path[:1] == "~" else path
+
+
+def _handle_introspection(args: "argparse.Namespace") -> Optional[int]:
     if args.print_defaults:
-        _emit_json(config_defaults())
-        return 0
+        return _print_defaults()
 
     if args.print_config_schema:
-        _emit_json(config_schema())
-        return 0
+        return _print_config_schema()
 
     if args.validate_config:
-        errors = validate_config_file(config_path)
+        from .config import validate_config_file
+        errors = validate_config_file(_config_path_arg(args))
         if errors:
             for error in errors:
                 print(error, file=sys.stderr)
@@ -293,85 +615,41 @@ def _handle_introspection(args: argparse.Namespace) -> Optional[int]:
         return 0
 
     if args.print_hook_contract:
-        _emit_json({
-            "events": [
-                {
-                    "name": "on_save",
-                    "args": ["output_path", "width", "height", "timestamp"],
-                    "description": "Called after a screenshot is saved",
-                }
-            ]
-        })
-        return 0
+        return _print_hook_contract()
 
     if args.print_resolved:
-        config = load_config(config_path=config_path)
+        from .config import config_to_dict, load_config
+        # Read-only: never leaves cache files behind
+        config = load_config(config_path=_config_path_arg(args), persist=False)
         _emit_json(config_to_dict(config))
         return 0
 
     if args.print_event_catalog:
-        _emit_json({
-            "catalog": [
-                {
-                    "event_type": "config.resolved",
-                    "lifecycle_point": "config.loaded",
-                    "data_fields": ["config_path", "source"],
-                },
-                {
-                    "event_type": "operation.started",
-                    "lifecycle_point": "operation.started",
-                    "data_fields": ["operation_type", "operation_id", "mode", "monitor"],
-                },
-                {
-                    "event_type": "operation.completed",
-                    "lifecycle_point": "artifact.created",
-                    "data_fields": ["operation_type", "operation_id", "outputs", "metadata", "mode", "monitor"],
-                },
-                {
-                    "event_type": "artifact.created",
-                    "lifecycle_point": "artifact.created",
-                    "data_fields": ["file_path", "file_type", "metadata"],
-                },
-                {
-                    "event_type": "error.handled",
-                    "lifecycle_point": "error.occurred",
-                    "data_fields": ["error_type", "message", "mode"],
-                },
-            ]
-        })
-        return 0
+        return _print_event_catalog()
 
     if args.print_lifecycle:
-        _emit_json({
-            "points": [
-                "startup",
-                "config.loaded",
-                "operation.started",
-                "artifact.created",
-                "error.occurred",
-                "shutdown",
-            ]
-        })
-        return 0
+        return _print_lifecycle()
 
     return None
 
 
-def handle_instant_capture(
-    args: argparse.Namespace,
-    config: Config,
-    options: OutputOptions,
+def _instant_capture(
+    config: "Config",
+    options: "OutputOptions",
+    monitor: Optional[str],
 ) -> int:
-    """Handle instant fullscreen capture."""
-    operation_id = _start_operation("instant", args.monitor)
+    """Capture the full screen (or one monitor), save it and report it."""
+    from .capture import fullscreen_bytes, CaptureError
+    from .output import save
+
+    operation_id = _start_operation("instant", monitor)
     try:
-        temp_path = fullscreen(monitor=args.monitor, config=config)
-        result = save(temp_path, options, config)
-        temp_path.unlink(missing_ok=True)
+        png = fullscreen_bytes(monitor=monitor, config=config)
+        result = save(png, options, config)
         _complete_operation(
             operation_id=operation_id,
             mode="instant",
-            monitor=args.monitor,
+            monitor=monitor,
             result=result,
         )
         return 0
@@ -380,31 +658,44 @@ def handle_instant_capture(
         _complete_operation(
             operation_id=operation_id,
             mode="instant",
-            monitor=args.monitor,
+            monitor=monitor,
             error_message=str(e),
         )
         log.error("Capture failed: %s", e)
         return 1
 
 
+def handle_instant_capture(
+    args: "argparse.Namespace",
+    config: "Config",
+    options: "OutputOptions",
+) -> int:
+    """Handle instant fullscreen capture."""
+    return _instant_capture(config, options, args.monitor)
+
+
 def handle_region_capture(
-    args: argparse.Namespace,
-    config: Config,
-    options: OutputOptions,
+    args: "argparse.Namespace",
+    config: "Config",
+    options: "OutputOptions",
 ) -> int:
     """Handle region capture."""
-    try:
-        parts = args.region.split(",")
-        x, y, w, h = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
-    except (ValueError, IndexError):
+    from .capture import region_bytes, CaptureError
+    from .output import save
+
+    match = _REGION_RE.fullmatch(args.region)
+    if match is None:
         log.error("Invalid region format. Use X,Y,W,H (e.g., 100,100,800,600)")
         return 1
+    x, y, w, h = map(int, match.groups())
+    if w <= 0 or h <= 0:
+        log.error("Invalid region size: width and height must be positive")
+        return 1
 
     operation_id = _start_operation("region", args.monitor)
     try:
-        temp_path = region(x, y, w, h, config=config)
-        result = save(temp_path, options, config)
-        temp_path.unlink(missing_ok=True)
+        png = region_bytes(x, y, w, h, config=config)
+        result = save(png, options, config)
         _complete_operation(
             operation_id=operation_id,
             mode="region",
@@ -425,16 +716,18 @@ def handle_region_capture(
 
 
 def handle_window_capture(
-    args: argparse.Namespace,
-    config: Config,
-    options: OutputOptions,
+    args: "argparse.Namespace",
+    config: "Config",
+    options: "OutputOptions",
 ) -> int:
     """Handle window capture."""
+    from .capture import window_bytes, CaptureError
+    from .output import save
+
     operation_id = _start_operation("window", args.monitor)
     try:
-        temp_path = window(args.window, config=config)
-        result = save(temp_path, options, config)
-        temp_path.unlink(missing_ok=True)
+        png = window_bytes(args.window, config=config)
+        result = save(png, options, config)
         _complete_operation(
             operation_id=operation_id,
             mode="window",
@@ -454,7 +747,7 @@ def handle_window_capture(
         return 1
 
 
-def handle_interactive(config: Config, instance_mgr: InstanceManager) -> int:
+def handle_interactive(config: "Config", instance_mgr: "InstanceManager") -> int:
     """Handle interactive mode."""
     # Check if already running
     if not instance_mgr.acquire_lock():
@@ -483,9 +776,16 @@ def main(args: Optional[list[str]] = None) -> int:
     Returns:
         Exit code
     """
+    argv = sys.argv[1:] if args is None else args
+    if len(argv) == 1 and argv[0] in _FAST_INTROSPECTION:
+        return _FAST_INTROSPECTION[argv[0]]()
+
     # STEP 1: Parse arguments first
-    parser = create_argument_parser()
-    parsed_args = parser.parse_args(args)
+    try:
+        parsed_args = _fast_parse(argv)
+    except (KeyError, ValueError):
+        parser = create_argument_parser(output_args=_needs_output_args(argv))
+        parsed_args = parser.parse_args(argv)
 
     # Introspection flags short-circuit normal execution
     result = _handle_introspection(parsed_args)
@@ -494,26 +794,39 @@ def main(args: Optional[list[str]] = None) -> int:
 
     # Configure event emitter and register shutdown
     # Suppress stderr events in silent mode (scripting/MCP captures stderr)
-    configure("screenshot-tool", stderr=not parsed_args.silent)
+    from .emit import configure
+    # Buffer events into one write at exit only for one-shot captures. The
+    # interactive overlay and double-tap sessions can live long and be
+    # killed by a later invocation, so they write each event as it happens;
+    # so does --json, whose stdout should interleave with events.
+    one_shot = bool(parsed_args.instant or parsed_args.region or parsed_args.window)
+    configure(
+        "screenshot-tool",
+        stderr=not parsed_args.silent,
+        buffer=one_shot and not parsed_args.json,
+    )
     atexit.register(lambda: emit("shutdown", {}))
 
     # Run hooks lifecycle startup (e.g., event transport injection)
-    try:
-        from screenshot_tool_hooks import run_lifecycle, shutdown_lifecycle
-        run_lifecycle("startup", {})
-        atexit.register(shutdown_lifecycle)
-    except (ImportError, Exception):
-        pass
+    if _has_hooks():
+        try:
+            _bootstrap_hooks()
+            from screenshot_tool_hooks import run_lifecycle, shutdown_lifecycle
+            run_lifecycle("startup", {})
+            atexit.register(shutdown_lifecycle)
+        except (ImportError, Exception):
+            pass
 
-    config_path = Path(parsed_args.config).expanduser() if parsed_args.config else None
+    from .config import load_config, set_config
+
+    config_path = _config_path_arg(parsed_args)
     config = load_config(config_path=config_path)
+    set_config(config)
 
     resolved_path = config_path or "default"
     source = "cli" if config_path else "default"
     emit("config.resolved", {"config_path": str(resolved_path), "source": source})
 
-    instance_mgr = InstanceManager(config)
-
     # Setup logging
     logging.basicConfig(
         level=logging.DEBUG if parsed_args.debug else logging.INFO,
@@ -522,42 +835,40 @@ def main(args: Optional[list[str]] = None) -> int:
 
     # STEP 2: Check for double-tap ONLY when no explicit capture mode
     # Double-tap is a hotkey feature for interactive mode, not for CLI with explicit args
+    # Instance management is only needed for double-tap and interactive
+    # mode, so explicit captures never import it
     has_explicit_mode = parsed_args.instant or parsed_args.region or parsed_args.window
-    if not has_explicit_mode and instance_mgr.check_double_tap():
+    instance_mgr: Optional["InstanceManager"] = None
+    if not has_explicit_mode:
+        from .instance import InstanceManager
+        instance_mgr = InstanceManager(config)
+
+    if instance_mgr is not None and instance_mgr.check_double_tap():
         log.debug("Double-tap detected - instant screenshot")
+        from .output import OutputOptions
+        from .wayfire import hide_cursor, show_cursor, shutdown_wayfire
+
         # Kill any running UI first
         instance_mgr.kill_running()
         instance_mgr.cleanup_stale_lock()
 
-        operation_id = _start_operation("instant", None)
         # Take instant screenshot with cursor hidden
         hide_cursor()
         try:
-            temp_path = fullscreen(config=config)
-            result = save(temp_path, OutputOptions(), config)
-            temp_path.unlink(missing_ok=True)
-            _complete_operation(
-                operation_id=operation_id,
-                mode="instant",
-                monitor=None,
-                result=result,
-            )
-        except CaptureError as e:
-            emit("error.handled", {"error_type": "CaptureError", "message": str(e), "mode": "instant"})
-            _complete_operation(
-                operation_id=operation_id,
-                mode="instant",
-                monitor=None,
-                error_message=str(e),
-            )
-            log.error("Capture failed: %s", e)
-            return 1
+            return _instant_capture(config, OutputOptions(), None)
         finally:
             show_cursor()
-        return 0
+            shutdown_wayfire()
+
+    # Region and monitor-less instant captures need the primary output;
+    # probe for it in the background while the delay and setup run
+    if parsed_args.region or (parsed_args.instant and not parsed_args.monitor):
+        from .capture import prefetch_outputs
+        prefetch_outputs(config)
 
     # Handle delay
     if parsed_args.delay:
+        import time
         time.sleep(parsed_args.delay / 1000.0)
 
     # Build output options
@@ -575,11 +886,13 @@ def main(args: Optional[list[str]] = None) -> int:
 
     # Default: interactive mode
     # Hide cursor before starting interactive mode
+    from .wayfire import hide_cursor, show_cursor, shutdown_wayfire
     hide_cursor()
     try:
         return handle_interactive(config, instance_mgr)
     finally:
         show_cursor()
+        shutdown_wayfire()
 
 
 if __name__ == "__main__":
@@ -7,69 +7,108 @@ Configuration priority (highest to lowest):
 4. Built-in defaults
 """
 
+import json
 import os
-from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Callable, Optional, Union
 
-import yaml
 from platformdirs import user_config_dir, user_data_dir, user_cache_dir
 
+from . import __version__
+
 ENV_PREFIX = "SCREENSHOT_TOOL"
 CONFIG_DIR = Path(user_config_dir("screenshot-tool"))
 DEFAULT_CONFIG_PATH = CONFIG_DIR / "config.yaml"
 
 
-@dataclass
-class Config:
-    """Screenshot tool configuration."""
+# Built-in defaults, computed once at import. Path objects are immutable,
+# so every Config instance can share them.
+_DEFAULT_DATA_DIR = Path(user_data_dir("screenshot-tool"))
+_DEFAULT_CACHE_DIR = Path(user_cache_dir("screenshot-tool"))
+_DEFAULT_OUTPUT_DIR = Path.home() / "Pictures" / "screenshots"
+_DEFAULT_LOCK_FILE = Path("/tmp/screenshot-tool.lock")
+_DEFAULT_DOUBLE_TAP_FILE = Path("/tmp/screenshot-tool.doubletap")
+_DEFAULT_SILENT_OUTPUT_DIR = Path("/tmp")
+_DEFAULT_HOOKS_DIR = CONFIG_DIR / "hooks"
 
+# Per-field defaults, in field order
+_FIELD_DEFAULTS: dict[str, Any] = {
     # Binary paths
-    wayland_capture: str = "wayland-capture"
-
+    "wayland_capture": "wayland-capture",
     # Output settings
-    data_dir: Path = field(default_factory=lambda: Path(user_data_dir("screenshot-tool")))
-    cache_dir: Path = field(default_factory=lambda: Path(user_cache_dir("screenshot-tool")))
-    output_dir: Path = field(default_factory=lambda: Path.home() / "Pictures" / "screenshots")
-    default_format: str = "png"
-    default_quality: int = 90
-
+    "data_dir": _DEFAULT_DATA_DIR,
+    "cache_dir": _DEFAULT_CACHE_DIR,
+    "output_dir": _DEFAULT_OUTPUT_DIR,
+    "default_format": "png",
+    "default_quality": 90,
     # Behavior
-    double_tap_ms: int = 500
-    enable_sound: bool = True
-    enable_notification: bool = True
-    enable_clipboard: bool = True
-
+    "double_tap_ms": 500,
+    "enable_sound": True,
+    "enable_notification": True,
+    "enable_clipboard": True,
+    "emit_progress_events": False,
     # Paths
-    lock_file: Path = field(default_factory=lambda: Path("/tmp/screenshot-tool.lock"))
-    double_tap_file: Path = field(default_factory=lambda: Path("/tmp/screenshot-tool.doubletap"))
-
+    "lock_file": _DEFAULT_LOCK_FILE,
+    "double_tap_file": _DEFAULT_DOUBLE_TAP_FILE,
     # Silent mode output (for scripting)
-    silent_output_dir: Path = field(default_factory=lambda: Path("/tmp"))
-
+    "silent_output_dir": _DEFAULT_SILENT_OUTPUT_DIR,
     # Hooks
-    hooks_dir: Optional[Path] = field(default_factory=lambda: CONFIG_DIR / "hooks")
-
-    def __post_init__(self):
-        # Convert string paths to Path objects
-        if isinstance(self.data_dir, str):
-            self.data_dir = Path(self.data_dir)
-        if isinstance(self.cache_dir, str):
-            self.cache_dir = Path(self.cache_dir)
-        if isinstance(self.output_dir, str):
-            self.output_dir = Path(self.output_dir)
-        if isinstance(self.lock_file, str):
-            self.lock_file = Path(self.lock_file)
-        if isinstance(self.double_tap_file, str):
-            self.double_tap_file = Path(self.double_tap_file)
-        if isinstance(self.silent_output_dir, str):
-            self.silent_output_dir = Path(self.silent_output_dir)
-        if isinstance(self.hooks_dir, str):
-            self.hooks_dir = Path(self.hooks_dir)
+    "hooks_dir": _DEFAULT_HOOKS_DIR,
+}
+
+
+class Config:
+    """Screenshot tool configuration.
+
+    Fields are keyword-only; omitted ones take their built-in default and
+    path fields given as strings are converted to Path.
+    """
+
+    __slots__ = tuple(_FIELD_DEFAULTS)
+
+    wayland_capture: str
+    data_dir: Path
+    cache_dir: Path
+    output_dir: Path
+    default_format: str
+    default_quality: int
+    double_tap_ms: int
+    enable_sound: bool
+    enable_notification: bool
+    enable_clipboard: bool
+    emit_progress_events: bool
+    lock_file: Path
+    double_tap_file: Path
+    silent_output_dir: Path
+    hooks_dir: Optional[Path]
+
+    def __init__(self, **kwargs: Any):
+        unknown = kwargs.keys() - _FIELD_DEFAULTS.keys()
+        if unknown:
+            raise TypeError(f"Unknown Config field(s): {', '.join(sorted(unknown))}")
+
+        for name, default in _FIELD_DEFAULTS.items():
+            if name in kwargs:
+                value = kwargs[name]
+                # Exact type check first: ints, bools and Path values skip the set lookup
+                if type(value) is str and name in PATH_KEYS:
+                    value = Path(value)
+            else:
+                value = default
+            setattr(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Config):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Config({values})"
 
 
 DEFAULT_FORMATS = {"png", "jpg", "jpeg", "webp"}
-PATH_KEYS = {
+PATH_KEYS = frozenset({
     "data_dir",
     "cache_dir",
     "output_dir",
@@ -77,25 +116,84 @@ PATH_KEYS = {
     "double_tap_file",
     "silent_output_dir",
     "hooks_dir",
-}
+})
 
 
-def _env(name: str) -> Optional[str]:
-    return os.environ.get(f"{ENV_PREFIX}_{name}")
+def _scan_env() -> dict[str, str]:
+    """Collect SCREENSHOT_TOOL_* variables, keyed by suffix, in one pass."""
+    prefix = f"{ENV_PREFIX}_"
+    start = len(prefix)
+    return {k[start:]: v for k, v in os.environ.items() if k.startswith(prefix)}
 
 
-def _config_path_from_env() -> Optional[Path]:
-    value = _env("CONFIG") or _env("CONFIG_PATH")
+def _config_path_from_env(env: Optional[dict[str, str]] = None) -> Optional[str]:
+    if env is None:
+        env = _scan_env()
+    value = env.get("CONFIG") or env.get("CONFIG_PATH")
     if value:
-        return Path(value).expanduser()
+        return _expand(value)
     return None
 
 
-def _load_config_file(path: Path, strict: bool = False) -> dict:
-    if not path.exists():
+def _yaml_sidecar_path() -> Path:
+    return _DEFAULT_CACHE_DIR / "config.yaml.json"
+
+
+def _load_yaml_sidecar(stamp: list) -> Optional[dict]:
+    try:
+        with open(_yaml_sidecar_path(), "rb") as f:
+            cached = json.load(f)
+        if cached.get("stamp") != stamp:
+            return None
+        data = cached["data"]
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _save_yaml_sidecar(stamp: list, data: dict) -> None:
+    sidecar = _yaml_sidecar_path()
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        payload = json.dumps({"stamp": stamp, "data": data})
+        # Only cache what JSON reproduces exactly (no dates, int keys, ...)
+        if json.loads(payload)["data"] != data:
+            return
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, sidecar)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _load_config_file(path: Path, strict: bool = False, persist: bool = True) -> dict:
+    """Parse the YAML config file into a dict ({} if it doesn't exist).
+
+    A successful parse is mirrored to a JSON sidecar in the cache dir
+    (unless persist is False), stamped with the file's path, mtime and
+    size; while the stamp still matches, the sidecar is read instead and
+    PyYAML is never imported. Strict loads (validation) always parse the
+    file itself and never touch the sidecar.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
         return {}
+
+    stamp = [str(path), st.st_mtime_ns, st.st_size]
+    if not strict:
+        cached = _load_yaml_sidecar(stamp)
+        if cached is not None:
+            return cached
+
+    # Imported only when a config file is actually present
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it; same safe schema.
+    # Bytes go straight to the parser, which detects the encoding itself.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        data = yaml.safe_load(path.read_text()) or {}
+        data = yaml.load(path.read_bytes(), Loader=loader) or {}
     except Exception as exc:
         if strict:
             raise ValueError(f"Failed to parse config file {path}: {exc}")
@@ -106,125 +204,268 @@ def _load_config_file(path: Path, strict: bool = False) -> dict:
             raise ValueError(f"Config file {path} must be a mapping")
         return {}
 
+    if persist and not strict:
+        _save_yaml_sidecar(stamp, data)
     return data
 
 
-def _expand_path(value: Any) -> Any:
-    if value is None:
+def _expand(path: str) -> str:
+    """Expand a leading ~; any other string is returned as is."""
+    return os.path.expanduser(path) if path[:1] == "~" else path
+
+
+def _to_path(value: Any) -> Path:
+    """Expand and wrap a path value; Path objects pass through untouched."""
+    if isinstance(value, Path):
         return value
-    return str(Path(value).expanduser())
+    return Path(_expand(os.fspath(value)))
+
+
+# JSON-ready defaults (paths as strings), computed once from _FIELD_DEFAULTS
+_DEFAULTS_FROZEN = {
+    key: str(value) if isinstance(value, Path) else value
+    for key, value in _FIELD_DEFAULTS.items()
+}
 
 
 def config_defaults() -> dict:
-    return {
-        "wayland_capture": "wayland-capture",
-        "data_dir": str(Path(user_data_dir("screenshot-tool"))),
-        "cache_dir": str(Path(user_cache_dir("screenshot-tool"))),
-        "output_dir": str(Path.home() / "Pictures" / "screenshots"),
-        "default_format": "png",
-        "default_quality": 90,
-        "double_tap_ms": 500,
-        "enable_sound": True,
-        "enable_notification": True,
-        "enable_clipboard": True,
-        "lock_file": "/tmp/screenshot-tool.lock",
-        "double_tap_file": "/tmp/screenshot-tool.doubletap",
-        "silent_output_dir": "/tmp",
-        "hooks_dir": str(CONFIG_DIR / "hooks"),
-    }
+    return dict(_DEFAULTS_FROZEN)
+
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _env_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+# SCREENSHOT_TOOL_<name> -> (config key, converter). A converter raising
+# ValueError leaves the key unset; paths stay raw strings here and are
+# expanded with every other source's in load_config's single _to_path pass.
+_ENV_TABLE: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "WAYLAND_CAPTURE": ("wayland_capture", str),
+    "DATA_DIR": ("data_dir", str),
+    "CACHE_DIR": ("cache_dir", str),
+    "OUTPUT_DIR": ("output_dir", str),
+    "DEFAULT_FORMAT": ("default_format", str),
+    "DEFAULT_QUALITY": ("default_quality", int),
+    "DOUBLE_TAP_MS": ("double_tap_ms", int),
+    "LOCK_FILE": ("lock_file", str),
+    "DOUBLE_TAP_FILE": ("double_tap_file", str),
+    "SILENT_OUTPUT_DIR": ("silent_output_dir", str),
+    "HOOKS_DIR": ("hooks_dir", str),
+    "ENABLE_SOUND": ("enable_sound", _env_bool),
+    "ENABLE_NOTIFICATION": ("enable_notification", _env_bool),
+    "ENABLE_CLIPBOARD": ("enable_clipboard", _env_bool),
+    "EMIT_PROGRESS_EVENTS": ("emit_progress_events", _env_bool),
+}
 
 
-def _load_env_overrides() -> dict:
+def _load_env_overrides(env: Optional[dict[str, str]] = None) -> dict:
+    if env is None:
+        env = _scan_env()
     config: dict[str, Any] = {}
 
-    mapping = {
-        "WAYLAND_CAPTURE": "wayland_capture",
-        "DATA_DIR": "data_dir",
-        "CACHE_DIR": "cache_dir",
-        "OUTPUT_DIR": "output_dir",
-        "DEFAULT_FORMAT": "default_format",
-        "DEFAULT_QUALITY": "default_quality",
-        "DOUBLE_TAP_MS": "double_tap_ms",
-        "LOCK_FILE": "lock_file",
-        "DOUBLE_TAP_FILE": "double_tap_file",
-        "SILENT_OUTPUT_DIR": "silent_output_dir",
-        "HOOKS_DIR": "hooks_dir",
-    }
-
-    for env_name, key in mapping.items():
-        value = _env(env_name)
-        if value is None:
+    # Walk the (usually tiny) set of variables actually present
+    for env_name, value in env.items():
+        spec = _ENV_TABLE.get(env_name)
+        if spec is None:
             continue
-        if key in {"output_dir", "lock_file", "double_tap_file", "silent_output_dir", "hooks_dir"}:
-            config[key] = _expand_path(value)
-        elif key in {"data_dir", "cache_dir"}:
-            config[key] = _expand_path(value)
-        elif key in {"double_tap_ms", "default_quality"}:
-            try:
-                config[key] = int(value)
-            except ValueError:
-                continue
-        else:
-            config[key] = value
-
-    for env_name, key in [
-        ("ENABLE_SOUND", "enable_sound"),
-        ("ENABLE_NOTIFICATION", "enable_notification"),
-        ("ENABLE_CLIPBOARD", "enable_clipboard"),
-    ]:
-        value = _env(env_name)
-        if value is None:
+        key, convert = spec
+        try:
+            config[key] = convert(value)
+        except ValueError:
             continue
-        config[key] = value.lower() in ("true", "1", "yes", "on")
 
     return config
 
 
-def resolve_config_path(config_path: Optional[Path] = None) -> Path:
-    return config_path or _config_path_from_env() or DEFAULT_CONFIG_PATH
+# Non-prefixed variables that feed platformdirs defaults
+_CACHE_ENV_KEYS = ("HOME", "XDG_CONFIG_HOME", "XDG_DATA_HOME", "XDG_CACHE_HOME")
+
+
+def _resolved_cache_path() -> Path:
+    return _DEFAULT_CACHE_DIR / "resolved.json"
+
+
+def _resolved_cache_key(config_path: Path, env: dict[str, str]) -> list:
+    """Everything a resolved config depends on, in JSON-comparable form."""
+    try:
+        st = os.stat(config_path)
+        file_sig = [st.st_mtime_ns, st.st_size]
+    except OSError:
+        file_sig = None
+    return [
+        __version__,
+        str(config_path),
+        file_sig,
+        sorted(map(list, env.items())),
+        [os.environ.get(k) for k in _CACHE_ENV_KEYS],
+    ]
+
+
+def _load_resolved_cache(key: list) -> Optional[dict]:
+    try:
+        with open(_resolved_cache_path(), "rb") as f:
+            cached = json.load(f)
+        if cached.get("key") != key:
+            return None
+        return cached["config"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _save_resolved_cache(key: list, config_dict: dict) -> None:
+    cache_path = _resolved_cache_path()
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        payload = json.dumps({"key": key, "config": config_dict})
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def resolve_config_path(
+    config_path: Union[str, Path, None] = None,
+    env: Optional[dict[str, str]] = None,
+) -> Path:
+    path = config_path or _config_path_from_env(env)
+    return Path(path) if path else DEFAULT_CONFIG_PATH
+
+
+# In-process memo for load_config(), oldest entry evicted first
+_LOAD_CACHE: dict[tuple, Config] = {}
+_LOAD_CACHE_MAXSIZE = 8
 
 
 def load_config(
-    config_path: Optional[Path] = None,
+    config_path: Union[str, Path, None] = None,
     overrides: Optional[dict] = None,
     strict: bool = False,
+    persist: bool = True,
+) -> Config:
+    """Load configuration from all sources.
+
+    Repeat calls in one process return the same Config (treat it as
+    read-only) while the arguments, the config file's mtime/size and the
+    SCREENSHOT_TOOL_* variables are unchanged; load_config.cache_clear()
+    forgets them.
+
+    With SCREENSHOT_TOOL_CONFIG_CACHE=1 (and no overrides or strict mode)
+    the resolved values are also cached in resolved.json in the user cache
+    dir, keyed on the same inputs plus the XDG variables and the package
+    version; a hit skips YAML parsing entirely. The key cannot see an edit
+    that keeps the file size within one mtime tick, hence opt-in.
+
+    persist=False never writes a cache file (for read-only introspection).
+    """
+    # One pass over os.environ serves every lookup below
+    env = _scan_env()
+    resolved_path = resolve_config_path(config_path, env)
+
+    try:
+        st = os.stat(resolved_path)
+        file_sig = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_sig = None
+    memo_key: Optional[tuple] = (
+        str(resolved_path),
+        file_sig,
+        tuple(sorted(env.items())),
+        tuple(sorted((overrides or {}).items())),
+        strict,
+    )
+    try:
+        config = _LOAD_CACHE.get(memo_key)
+    except TypeError:
+        # Unhashable override value; load without memoizing
+        memo_key = None
+        config = None
+    if config is not None:
+        return config
+
+    config = _load_config(resolved_path, env, overrides, strict, persist)
+    if memo_key is not None:
+        if len(_LOAD_CACHE) >= _LOAD_CACHE_MAXSIZE:
+            del _LOAD_CACHE[next(iter(_LOAD_CACHE))]
+        _LOAD_CACHE[memo_key] = config
+    return config
+
+
+load_config.cache_clear = _LOAD_CACHE.clear  # type: ignore[attr-defined]
+
+
+def _load_config(
+    resolved_path: Path,
+    env: dict[str, str],
+    overrides: Optional[dict],
+    strict: bool,
+    persist: bool,
 ) -> Config:
-    """Load configuration from all sources."""
-    resolved_path = resolve_config_path(config_path)
+    use_cache = not overrides and not strict and env.get("CONFIG_CACHE") == "1"
+    if use_cache:
+        cache_key = _resolved_cache_key(resolved_path, env)
+        cached = _load_resolved_cache(cache_key)
+        if cached is not None:
+            try:
+                return Config(**cached)
+            except TypeError:
+                pass
 
-    config_dict = config_defaults()
-    file_config = _load_config_file(resolved_path, strict=strict)
+    # Defaults are already Path objects, so _to_path below leaves them be
+    config_dict = dict(_FIELD_DEFAULTS)
+    file_config = _load_config_file(resolved_path, strict=strict, persist=persist)
     config_dict.update(file_config)
-    config_dict.update(_load_env_overrides())
+    config_dict.update(_load_env_overrides(env))
 
     if overrides:
         for key, value in overrides.items():
             if value is not None:
                 config_dict[key] = value
 
+    # One normalization step for every source: expand ~ and wrap in Path
     for key in PATH_KEYS:
-        if key in config_dict and config_dict[key] is not None:
-            config_dict[key] = _expand_path(config_dict[key])
+        value = config_dict.get(key)
+        if value is not None:
+            config_dict[key] = _to_path(value)
 
     # Filter out unknown keys to prevent TypeError on Config()
-    valid_keys = {f.name for f in fields(Config)}
-    config_dict = {k: v for k, v in config_dict.items() if k in valid_keys}
-
-    return Config(**config_dict)
+    config_dict = {k: v for k, v in config_dict.items() if k in _FIELD_DEFAULTS}
+
+    config = Config(**config_dict)
+    if use_cache and persist:
+        _save_resolved_cache(cache_key, {
+            key: os.fspath(value) if isinstance(value, Path) else value
+            for key, value in config_dict.items()
+        })
+    return config
 
 
-# Global config instance (lazy loaded)
+# Global config instance (lazy loaded, or primed by set_config)
 _config: Optional[Config] = None
 
 
 def get_config() -> Config:
-    """Get the global configuration instance."""
+    """Get the process-wide configuration instance.
+
+    Loaded on first use unless set_config() has already primed it, so
+    capture helpers, output handling and hook modules all share the
+    object the CLI resolved instead of re-reading the config file.
+    """
     global _config
     if _config is None:
         _config = load_config()
     return _config
 
 
+def set_config(config: Optional[Config]) -> None:
+    """Install config as the process-wide instance (None resets it)."""
+    global _config
+    _config = config
+
+
 def config_schema() -> dict:
     return {
         "$schema": "https://json-schema.org/draft/2020-12/schema",
@@ -240,6 +481,7 @@ def config_schema() -> dict:
             "enable_sound": {"type": "boolean"},
             "enable_notification": {"type": "boolean"},
             "enable_clipboard": {"type": "boolean"},
+            "emit_progress_events": {"type": "boolean"},
             "lock_file": {"type": "string"},
             "double_tap_file": {"type": "string"},
             "silent_output_dir": {"type": "string"},
@@ -253,54 +495,88 @@ def _is_int(value: Any) -> bool:
     return isinstance(value, int) and not isinstance(value, bool)
 
 
-def validate_config_dict(data: Any) -> list[str]:
-    errors: list[str] = []
-    if not isinstance(data, dict):
-        return ["Config must be a mapping/object"]
+def _check_str(key: str, value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return f"{key} must be a string"
+    return None
+
+
+def _check_bool(key: str, value: Any) -> Optional[str]:
+    if not isinstance(value, bool):
+        return f"{key} must be a boolean"
+    return None
+
+
+def _check_optional_str(key: str, value: Any) -> Optional[str]:
+    if value is not None and not isinstance(value, str):
+        return f"{key} must be one of types: string, null"
+    return None
+
+
+def _check_format(key: str, value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return f"{key} must be a string"
+    if value not in DEFAULT_FORMATS:
+        return f"{key} must be one of: {', '.join(sorted(DEFAULT_FORMATS))}"
+    return None
+
+
+def _check_quality(key: str, value: Any) -> Optional[str]:
+    if not _is_int(value):
+        return f"{key} must be an integer"
+    if value < 1 or value > 100:
+        return f"{key} must be between 1 and 100"
+    return None
 
-    schema = config_schema()
-    props = schema.get("properties", {})
-    allowed_keys = set(props.keys())
 
-    for key in data.keys():
-        if key not in allowed_keys:
-            errors.append(f"Unknown config key: {key}")
+def _check_non_negative_int(key: str, value: Any) -> Optional[str]:
+    if not _is_int(value):
+        return f"{key} must be an integer"
+    if value < 0:
+        return f"{key} must be >= 0"
+    return None
 
-    def check_type(key: str, value: Any, expected: str) -> None:
-        if expected == "string" and not isinstance(value, str):
-            errors.append(f"{key} must be a string")
-        elif expected == "integer" and not _is_int(value):
-            errors.append(f"{key} must be an integer")
-        elif expected == "boolean" and not isinstance(value, bool):
-            errors.append(f"{key} must be a boolean")
 
+# One validator per config key, mirroring config_schema()
+_VALIDATORS: dict[str, Callable[[str, Any], Optional[str]]] = {
+    "wayland_capture": _check_str,
+    "data_dir": _check_str,
+    "cache_dir": _check_str,
+    "output_dir": _check_str,
+    "default_format": _check_format,
+    "default_quality": _check_quality,
+    "double_tap_ms": _check_non_negative_int,
+    "enable_sound": _check_bool,
+    "enable_notification": _check_bool,
+    "enable_clipboard": _check_bool,
+    "emit_progress_events": _check_bool,
+    "lock_file": _check_str,
+    "double_tap_file": _check_str,
+    "silent_output_dir": _check_str,
+    "hooks_dir": _check_optional_str,
+}
+
+
+def validate_config_dict(data: Any) -> list[str]:
+    if not isinstance(data, dict):
+        return ["Config must be a mapping/object"]
+
+    # Unknown keys are reported first, as before
+    unknown: list[str] = []
+    errors: list[str] = []
     for key, value in data.items():
-        if key not in props:
-            continue
-        spec = props[key]
-        expected = spec.get("type")
-        if isinstance(expected, list):
-            if value is None and "null" in expected:
-                continue
-            if "string" in expected and isinstance(value, str):
-                continue
-            errors.append(f"{key} must be one of types: {', '.join(expected)}")
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            unknown.append(f"Unknown config key: {key}")
             continue
-        if isinstance(expected, str):
-            check_type(key, value, expected)
-
-        if key == "default_format" and value not in DEFAULT_FORMATS:
-            errors.append(f"default_format must be one of: {', '.join(sorted(DEFAULT_FORMATS))}")
-        if key == "default_quality" and _is_int(value):
-            if value < 1 or value > 100:
-                errors.append("default_quality must be between 1 and 100")
-        if key == "double_tap_ms" and _is_int(value) and value < 0:
-            errors.append("double_tap_ms must be >= 0")
+        error = validator(key, value)
+        if error:
+            errors.append(error)
 
-    return errors
+    return unknown + errors
 
 
-def validate_config_file(config_path: Optional[Path] = None) -> list[str]:
+def validate_config_file(config_path: Union[str, Path, None] = None) -> list[str]:
     path = resolve_config_path(config_path)
     if not path.exists():
         return []
@@ -309,24 +585,22 @@ def validate_config_file(config_path: Optional[Path] = None) -> list[str]:
 
 
 def config_to_dict(config: Config) -> dict:
-    def _format(value: Any) -> Any:
-        if isinstance(value, Path):
-            return str(value)
-        return value
-
+    # Path fields are exactly PATH_KEYS, so str() them unconditionally
+    hooks_dir = config.hooks_dir
     return {
         "wayland_capture": config.wayland_capture,
-        "data_dir": _format(config.data_dir),
-        "cache_dir": _format(config.cache_dir),
-        "output_dir": _format(config.output_dir),
+        "data_dir": str(config.data_dir),
+        "cache_dir": str(config.cache_dir),
+        "output_dir": str(config.output_dir),
         "default_format": config.default_format,
         "default_quality": config.default_quality,
         "double_tap_ms": config.double_tap_ms,
         "enable_sound": config.enable_sound,
         "enable_notification": config.enable_notification,
         "enable_clipboard": config.enable_clipboard,
-        "lock_file": _format(config.lock_file),
-        "double_tap_file": _format(config.double_tap_file),
-        "silent_output_dir": _format(config.silent_output_dir),
-        "hooks_dir": _format(config.hooks_dir) if config.hooks_dir else None,
+        "emit_progress_events": config.emit_progress_events,
+        "lock_file": str(config.lock_file),
+        "double_tap_file": str(config.double_tap_file),
+        "silent_output_dir": str(config.silent_output_dir),
+        "hooks_dir": str(hooks_dir) if hooks_dir else None,
     }
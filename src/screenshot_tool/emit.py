@@ -10,12 +10,16 @@ Event format (matches Systems infra/events/publisher.py schema):
     {"event_type": "...", "timestamp": "...", "source": {"tool": "..."}, "data": {...}}
 
 Events are always single-line JSON on stderr, distinguishable from log lines.
+With configure(buffer=True) they are held in memory and written with one
+vectored write at exit, on flush(), or once flush_every events queue up.
 """
 
+import atexit
 import json
+import os
 import sys
+import time
 import logging
-from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -25,18 +29,69 @@ EventHandler = Callable[[dict], None]
 _handlers: List[EventHandler] = []
 _source: str = "unknown"
 _stderr_enabled: bool = True
-
-
-def configure(source: str, stderr: bool = True) -> None:
+_buffering: bool = False
+_buffer: List[str] = []
+_flush_every: int = 32
+_flush_registered: bool = False
+
+# Stay under IOV_MAX (1024 on Linux) per writev call
+_IOV_BATCH = 1024
+
+# Reused encoder for event lines (json.dumps builds one per call when
+# given non-default options)
+_encoder = json.JSONEncoder(default=str, ensure_ascii=False, separators=(",", ":"))
+# Serialized {"tool": _source}, refreshed by configure()
+_source_json: str = _encoder.encode({"tool": _source})
+
+
+def configure(
+    source: str,
+    stderr: bool = True,
+    buffer: bool = False,
+    flush_every: int = 32,
+) -> None:
     """Set the source name for emitted events. Call once at startup.
 
     Args:
         source: Source identifier for events
         stderr: Whether to write events to stderr (disable for scripting/MCP)
+        buffer: Hold stderr events until flush(), interpreter exit, or
+            flush_every events have queued up
+        flush_every: Queue length that triggers a flush while buffering
+            (1 writes every event immediately)
     """
-    global _source, _stderr_enabled
+    global _source, _source_json, _stderr_enabled, _buffering, _flush_every, _flush_registered
     _source = source
+    _source_json = _encoder.encode({"tool": source})
     _stderr_enabled = stderr
+    _buffering = buffer
+    _flush_every = max(1, flush_every)
+    if buffer and not _flush_registered:
+        # Registered before any caller's atexit emit, so it runs after it
+        atexit.register(flush)
+        _flush_registered = True
+    elif not buffer:
+        flush()
+
+
+def flush() -> None:
+    """Write buffered events to stderr, one writev() per batch."""
+    if not _buffer:
+        return
+    chunks = [line.encode() for line in _buffer]
+    _buffer.clear()
+    try:
+        sys.stderr.flush()
+        fd = sys.stderr.fileno()
+        while chunks:
+            written = os.writev(fd, chunks[:_IOV_BATCH])
+            # Drop fully written chunks, trim a partially written one
+            while chunks and written >= len(chunks[0]):
+                written -= len(chunks.pop(0))
+            if written:
+                chunks[0] = chunks[0][written:]
+    except (OSError, ValueError, AttributeError):
+        pass
 
 
 def add_handler(handler: EventHandler) -> None:
@@ -50,6 +105,16 @@ def remove_handler(handler: EventHandler) -> None:
         _handlers.remove(handler)
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds, without datetime."""
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{ns // 1000:06d}+00:00"
+    )
+
+
 def emit(
     event_type: str,
     data: Dict[str, Any],
@@ -58,7 +123,7 @@ def emit(
     """
     Emit a structured event.
 
-    Default: writes one JSON line to stderr.
+    Default: writes one JSON line to stderr (queued when buffering).
     Additional handlers receive the same event dict.
 
     Args:
@@ -66,20 +131,35 @@ def emit(
         data: Event payload
         source: Override source name for this event
     """
+    timestamp = _utc_timestamp()
     event = {
         "event_type": event_type,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp,
         "source": {
             "tool": source or _source,
         },
         "data": data,
     }
 
-    # Default: structured JSON to stderr (one line per event)
+    # Default: structured JSON to stderr (one line per event). Assembled
+    # from parts so the configured source is never re-serialized; key
+    # order matches the event dict.
     if _stderr_enabled:
         try:
-            line = json.dumps(event, default=str)
-            print(line, file=sys.stderr, flush=True)
+            source_json = _encoder.encode(event["source"]) if source else _source_json
+            line = (
+                '{"event_type":' + _encoder.encode(event_type)
+                + ',"timestamp":"' + timestamp
+                + '","source":' + source_json
+                + ',"data":' + _encoder.encode(data)
+                + "}"
+            )
+            if _buffering:
+                _buffer.append(line + "\n")
+                if len(_buffer) >= _flush_every:
+                    flush()
+            else:
+                print(line, file=sys.stderr, flush=True)
         except Exception:
             pass
 
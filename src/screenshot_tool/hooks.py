@@ -19,6 +19,9 @@ Hook scripts should:
 """
 
 import logging
+import os
+import signal
+import stat
 import subprocess
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
@@ -29,6 +32,61 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# (event_dir, event) -> (dir st_mtime_ns, sorted executable scripts).
+# Adding, removing or renaming a script bumps the directory mtime; a chmod
+# on an existing script does not, so that needs a new process to notice.
+_hook_cache: dict[tuple[str, str], tuple[int, list[Path]]] = {}
+
+
+def _executable_scripts(event_dir: Path) -> list[Path]:
+    """List executable, non-hidden regular files in event_dir, sorted by name."""
+    # scandir hands back the entry type with the directory read, so only
+    # regular files cost a stat (for the mode bits)
+    entries = []
+    with os.scandir(event_dir) as it:
+        for entry in it:
+            if entry.name.startswith('.') or not entry.is_file():
+                continue
+            entries.append((entry.name, entry.path, entry.stat().st_mode))
+    entries.sort()
+
+    scripts = []
+    for name, path, mode in entries:
+        if not mode & 0o111:
+            log.debug("Skipping non-executable: %s", path)
+            continue
+        scripts.append(Path(path))
+    return scripts
+
+
+# stdout/stderr -> /dev/null for hook children (None: no posix_spawn here)
+_DEVNULL_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+] if hasattr(os, "posix_spawn") else None
+
+# Python ignores these at startup and an ignored disposition survives exec;
+# reset them for children as subprocess's restore_signals does
+_RESTORE_SIGNALS = (signal.SIGPIPE, signal.SIGXFSZ)
+
+
+def _spawn_detached(argv: list[str]) -> None:
+    """Start argv in the background with stdout/stderr discarded.
+
+    Uses os.posix_spawn (vfork+exec on glibc); subprocess falls back to a
+    full fork whenever output is redirected. The child is not waited on:
+    the tool exits shortly after the hooks run and init reaps it.
+    """
+    if _DEVNULL_ACTIONS is not None:
+        os.posix_spawn(argv[0], argv, os.environ, file_actions=_DEVNULL_ACTIONS,
+                       setsigdef=_RESTORE_SIGNALS)
+        return
+    subprocess.Popen(
+        argv,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
 
 def run_hooks(hooks_dir: Optional[Path], event: str, *args) -> None:
     """Run all hook scripts for an event.
@@ -42,28 +100,33 @@ def run_hooks(hooks_dir: Optional[Path], event: str, *args) -> None:
         return
 
     event_dir = hooks_dir / f"{event}.d"
-    if not event_dir.exists() or not event_dir.is_dir():
+    try:
+        st = event_dir.stat()
+    except OSError:
+        return
+    if not stat.S_ISDIR(st.st_mode):
         return
 
-    # Get all executable scripts, sorted by name
-    scripts = sorted(
-        f for f in event_dir.iterdir()
-        if f.is_file() and not f.name.startswith('.')
-    )
-
+    # Executable scripts, sorted by name; rescanned only when the dir changes
+    key = (str(event_dir), event)
+    cached = _hook_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        scripts = cached[1]
+    else:
+        try:
+            scripts = _executable_scripts(event_dir)
+        except OSError as e:
+            log.warning("Cannot read hooks in %s: %s", event_dir, e)
+            return
+        _hook_cache[key] = (st.st_mtime_ns, scripts)
+
+    str_args = [str(a) for a in args]
+    # Each script is spawned directly, not fanned out from one shell, so
+    # exec failures (missing interpreter, no shebang) are logged per hook
     for script in scripts:
         try:
-            # Check if executable
-            if not script.stat().st_mode & 0o111:
-                log.debug("Skipping non-executable: %s", script)
-                continue
-
             # Run in background (non-blocking)
-            subprocess.Popen(
-                [str(script)] + [str(a) for a in args],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            _spawn_detached([str(script)] + str_args)
             log.debug("Hook executed: %s", script.name)
         except Exception as e:
             log.warning("Hook %s failed: %s", script.name, e)
@@ -12,7 +12,7 @@ import os
 import signal
 import time
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import Optional
 
 from .config import Config
 
@@ -24,7 +24,7 @@ class InstanceManager:
 
     def __init__(self, config: Config):
         self.config = config
-        self._lock_fd: Optional[TextIO] = None
+        self._lock_fd: Optional[int] = None
 
     def check_double_tap(self) -> bool:
         """Check if this invocation is a double-tap.
@@ -37,25 +37,35 @@ class InstanceManager:
         Returns:
             True if this is a double-tap, False otherwise
         """
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
         is_double_tap = False
 
+        # The marker's mtime is the previous tap time: one stat, no read.
+        # The common no-marker case is a single failed stat.
         double_tap_file = self.config.double_tap_file
         try:
-            if double_tap_file.exists():
-                last_ms = int(double_tap_file.read_text().strip())
-                diff = now_ms - last_ms
-                if diff < self.config.double_tap_ms:
-                    is_double_tap = True
+            last_ms = double_tap_file.stat().st_mtime_ns // 1_000_000
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.debug("Could not stat double-tap file: %s", e)
+        else:
+            diff = now_ms - last_ms
+            if diff < self.config.double_tap_ms:
+                is_double_tap = True
+                try:
                     double_tap_file.unlink(missing_ok=True)
-                    log.debug("Double-tap detected (diff=%dms)", diff)
-        except (ValueError, OSError) as e:
-            log.debug("Could not read double-tap file: %s", e)
+                except OSError as e:
+                    log.debug("Could not remove double-tap file: %s", e)
+                log.debug("Double-tap detected (diff=%dms)", diff)
 
         # Record this invocation time (unless it was a double-tap)
         if not is_double_tap:
             try:
-                double_tap_file.write_text(str(now_ms))
+                try:
+                    os.utime(double_tap_file)
+                except FileNotFoundError:
+                    os.close(os.open(double_tap_file, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o644))
             except OSError as e:
                 log.debug("Could not write double-tap file: %s", e)
 
@@ -70,31 +80,30 @@ class InstanceManager:
         """
         lock_file = self.config.lock_file
         try:
-            # Use 'a+' mode to avoid truncating existing file
-            self._lock_fd = open(lock_file, "a+")
-            fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-            # Got the lock - write our PID
-            self._lock_fd.seek(0)
-            self._lock_fd.truncate()
+            # No O_TRUNC: the running instance's PID must survive until we
+            # actually hold the lock
+            self._lock_fd = os.open(lock_file, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # Got the lock - write our PID (unbuffered, at offset 0)
+            os.ftruncate(self._lock_fd, 0)
             pid = os.getpid()
-            self._lock_fd.write(str(pid))
-            self._lock_fd.flush()
+            os.write(self._lock_fd, str(pid).encode())
             log.debug("Lock acquired, PID=%d", pid)
             return True
-        except (IOError, OSError) as e:
+        except OSError as e:
             log.debug("Lock acquisition failed: %s", e)
-            if self._lock_fd:
-                self._lock_fd.close()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
                 self._lock_fd = None
             return False
 
     def release_lock(self):
         """Release the lock file."""
-        if self._lock_fd:
+        if self._lock_fd is not None:
             try:
-                fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_UN)
-                self._lock_fd.close()
-            except (IOError, OSError):
+                # Closing the last fd drops the flock
+                os.close(self._lock_fd)
+            except OSError:
                 pass
             self._lock_fd = None
 
@@ -109,12 +118,17 @@ class InstanceManager:
         Returns:
             PID if another instance is running, None otherwise
         """
-        lock_file = self.config.lock_file
-        if not lock_file.exists():
+        try:
+            fd = os.open(self.config.lock_file, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
             return None
 
         try:
-            pid = int(lock_file.read_text().strip())
+            try:
+                data = os.read(fd, 32)
+            finally:
+                os.close(fd)
+            pid = int(data.strip())
             # Check if process exists
             os.kill(pid, 0)
             return pid
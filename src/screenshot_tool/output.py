@@ -10,23 +10,28 @@ Handles:
 
 import json
 import logging
+import os
+import signal
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-import gi
-gi.require_version("GdkPixbuf", "2.0")
-from gi.repository import GdkPixbuf
+from typing import Callable, Optional, Union, TYPE_CHECKING
 
 from .config import Config, get_config
 from .hooks import notify_save
 
+if TYPE_CHECKING:
+    import cairo
+    from gi.repository import GdkPixbuf
+
 log = logging.getLogger(__name__)
 
+# Output directories already created by this process
+_mkdir_cache: set[Path] = set()
 
-@dataclass
+
+@dataclass(slots=True)
 class OutputOptions:
     """Options for output handling."""
 
@@ -73,11 +78,29 @@ class OutputResult:
         return json.dumps(self.to_dict())
 
 
+_WL_COPY_ARGV = ("wl-copy", "-t", "image/png")
+
+# Ignored by Python at startup; reset for wl-copy (and the daemon it forks)
+# the way subprocess's restore_signals would
+_RESTORE_SIGNALS = (signal.SIGPIPE, signal.SIGXFSZ)
+
+
 def _copy_to_clipboard(path: Path):
     """Copy image to clipboard using wl-copy."""
     try:
-        with open(path, "rb") as f:
-            subprocess.run(["wl-copy", "-t", "image/png"], stdin=f, check=True)
+        # The file itself becomes wl-copy's stdin; no Python file object or
+        # subprocess machinery in between
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            pid = os.posix_spawnp(_WL_COPY_ARGV[0], _WL_COPY_ARGV, os.environ,
+                                  file_actions=[(os.POSIX_SPAWN_DUP2, fd, 0)],
+                                  setsigdef=_RESTORE_SIGNALS)
+        finally:
+            os.close(fd)
+        _, status = os.waitpid(pid, 0)
+        code = os.waitstatus_to_exitcode(status)
+        if code != 0:
+            raise subprocess.CalledProcessError(code, _WL_COPY_ARGV)
         log.debug("Copied to clipboard")
     except Exception as e:
         log.warning("Failed to copy to clipboard: %s", e)
@@ -98,6 +121,7 @@ def _play_sound():
 def _show_notification(path: Path, width: int, height: int):
     """Show desktop notification."""
     try:
+        import gi
         gi.require_version("Notify", "0.7")
         from gi.repository import Notify
         Notify.init("Screenshot Tool")
@@ -112,42 +136,42 @@ def _show_notification(path: Path, width: int, height: int):
         log.debug("Could not show notification: %s", e)
 
 
+def load_pixbuf(source: Union[Path, bytes]) -> "GdkPixbuf.Pixbuf":
+    """Load an image from a file path or from encoded bytes in memory."""
+    # Deferred: loading the GdkPixbuf typelib is only worth it when saving
+    import gi
+    gi.require_version("GdkPixbuf", "2.0")
+    from gi.repository import GdkPixbuf
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        # Decoded in one C call from a memory stream over the bytes
+        from gi.repository import Gio, GLib
+        stream = Gio.MemoryInputStream.new_from_bytes(GLib.Bytes.new(bytes(source)))
+        return GdkPixbuf.Pixbuf.new_from_stream(stream, None)
+    return GdkPixbuf.Pixbuf.new_from_file(str(source))
+
+
 def save(
-    source_path: Path,
+    source: Union[Path, bytes],
     options: Optional[OutputOptions] = None,
     config: Optional[Config] = None,
 ) -> OutputResult:
     """Save screenshot with all post-processing.
 
     Args:
-        source_path: Path to the captured image (will be deleted after processing)
+        source: Path to the captured image, or its encoded bytes
+            (the caller remains responsible for deleting a source file)
         options: Output options
         config: Configuration object
 
     Returns:
         OutputResult with final path and metadata
     """
-    options = options or OutputOptions()
-    config = config or get_config()
-
-    # Load image
-    img = GdkPixbuf.Pixbuf.new_from_file(str(source_path))
-    width = img.get_width()
-    height = img.get_height()
+    return _save_pixbuf_impl(load_pixbuf(source), options, config)
 
-    # Determine output path
-    if options.output_path:
-        output_path = options.output_path
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-    elif options.silent:
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_path = config.silent_output_dir / f"screenshot_{timestamp}.{options.output_format}"
-    else:
-        config.output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_path = config.output_dir / f"screenshot_{timestamp}.{options.output_format}"
 
-    # Save in requested format
+def _write_pixbuf(img: "GdkPixbuf.Pixbuf", output_path: Path, options: OutputOptions) -> Path:
+    """Encode img to output_path in the requested format; returns the final path."""
     output_format = options.output_format.lower()
     if output_format == "png":
         img.savev(str(output_path), "png", [], [])
@@ -163,6 +187,54 @@ def save(
     else:
         # Default to PNG for unknown formats
         img.savev(str(output_path), "png", [], [])
+    return output_path
+
+
+def _save_pixbuf_impl(
+    img: "GdkPixbuf.Pixbuf",
+    options: Optional[OutputOptions],
+    config: Optional[Config],
+) -> OutputResult:
+    """Write an already-decoded image and run all post-processing."""
+    options = options or OutputOptions()
+    return _save_image(
+        img.get_width(),
+        img.get_height(),
+        lambda output_path: _write_pixbuf(img, output_path, options),
+        options,
+        config,
+    )
+
+
+def _save_image(
+    width: int,
+    height: int,
+    write: Callable[[Path], Path],
+    options: OutputOptions,
+    config: Optional[Config],
+) -> OutputResult:
+    """Pick the output path, write via write(path), then post-process."""
+    config = config or get_config()
+
+    # One clock read for both the filename and the result timestamp
+    now = datetime.now()
+
+    # Determine output path
+    if options.output_path:
+        output_path = options.output_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    elif options.silent:
+        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
+        output_path = config.silent_output_dir / f"screenshot_{timestamp}.{options.output_format}"
+    else:
+        if config.output_dir not in _mkdir_cache:
+            config.output_dir.mkdir(parents=True, exist_ok=True)
+            _mkdir_cache.add(config.output_dir)
+        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
+        output_path = config.output_dir / f"screenshot_{timestamp}.{options.output_format}"
+
+    # Save in requested format
+    output_path = write(output_path)
 
     # Post-processing
     if options.clipboard:
@@ -179,7 +251,7 @@ def save(
         path=output_path,
         width=width,
         height=height,
-        timestamp=datetime.now().isoformat(),
+        timestamp=now.isoformat(),
     )
 
     # Notify hooks (runs asynchronously, won't block)
@@ -197,7 +269,7 @@ def save(
 
 
 def save_pixbuf(
-    pixbuf: GdkPixbuf.Pixbuf,
+    pixbuf: "GdkPixbuf.Pixbuf",
     options: Optional[OutputOptions] = None,
     config: Optional[Config] = None,
 ) -> OutputResult:
@@ -211,17 +283,42 @@ def save_pixbuf(
     Returns:
         OutputResult with final path and metadata
     """
-    import tempfile
+    return _save_pixbuf_impl(pixbuf, options, config)
 
-    # Save to temp file first
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        temp_path = Path(tmp.name)
-    pixbuf.savev(str(temp_path), "png", [], [])
 
-    # Use main save function
-    result = save(temp_path, options, config)
+def save_surface(
+    surface: "cairo.Surface",
+    width: int,
+    height: int,
+    options: Optional[OutputOptions] = None,
+    config: Optional[Config] = None,
+) -> OutputResult:
+    """Save a Cairo surface directly (for UI cropped regions).
 
-    # Clean up temp file
-    temp_path.unlink(missing_ok=True)
+    PNG is encoded by Cairo straight from the surface, so a sub-surface of
+    the overlay's background needs no pixel copy. Other formats go through
+    a GdkPixbuf.
 
-    return result
+    Args:
+        surface: The image to save (may be a sub-surface)
+        width: Surface width in pixels
+        height: Surface height in pixels
+        options: Output options
+        config: Configuration object
+
+    Returns:
+        OutputResult with final path and metadata
+    """
+    options = options or OutputOptions()
+    if options.output_format.lower() != "png":
+        import gi
+        gi.require_version("Gdk", "3.0")
+        from gi.repository import Gdk
+        pixbuf = Gdk.pixbuf_get_from_surface(surface, 0, 0, width, height)
+        return _save_pixbuf_impl(pixbuf, options, config)
+
+    def write(output_path: Path) -> Path:
+        surface.write_to_png(str(output_path))
+        return output_path
+
+    return _save_image(width, height, write, options, config)
@@ -1,28 +1,113 @@
 """Cairo drawing helpers for the screenshot overlay."""
 
+from typing import Optional
+
 import cairo
 
+INSTRUCTIONS = (
+    "Click window: Capture window",
+    "Drag: Select area",
+    "PrintScreen: Full screen",
+    "Arrow keys: Fine adjust",
+    "ESC/Right-click: Cancel",
+)
+
+# (text, font size, face, weight) -> TextExtents; the strings measured here
+# are constant, so each is measured once per process
+_extents_cache: dict[tuple[str, int, str, int], cairo.TextExtents] = {}
+_scratch_cr: Optional[cairo.Context] = None
+
+# (x, y) -> (pre-rendered instructions panel, its top-left corner)
+_instructions_surfaces: dict[tuple[int, int], tuple[cairo.ImageSurface, int, int]] = {}
+
+# (family, size, weight) -> ScaledFont
+_font_cache: dict[tuple[str, int, int], cairo.ScaledFont] = {}
+
+# Crosshair size -> its two lines as a path centred on the origin
+_crosshair_paths: dict[int, cairo.Path] = {}
+
+
+def _scratch() -> cairo.Context:
+    """Private 1x1 context for building paths."""
+    global _scratch_cr
+    if _scratch_cr is None:
+        _scratch_cr = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+    return _scratch_cr
+
+
+def get_font(family: str, size: int, weight=cairo.FONT_WEIGHT_NORMAL) -> cairo.ScaledFont:
+    """Return a cached ScaledFont, for cr.set_scaled_font().
+
+    Replaces select_font_face() + set_font_size(), which rebuild the scaled
+    font on every call. Built for an identity CTM, which is what the overlay
+    draws text with.
+    """
+    key = (family, size, int(weight))
+    font = _font_cache.get(key)
+    if font is None:
+        face = cairo.ToyFontFace(family, cairo.FONT_SLANT_NORMAL, weight)
+        font = cairo.ScaledFont(face, cairo.Matrix(xx=size, yy=size), cairo.Matrix(), cairo.FontOptions())
+        _font_cache[key] = font
+    return font
+
+
+def _text_extents(text: str, size: int, face: str, weight=cairo.FONT_WEIGHT_NORMAL) -> cairo.TextExtents:
+    """Return cached extents of text in the given font."""
+    key = (text, size, face, int(weight))
+    extents = _extents_cache.get(key)
+    if extents is None:
+        extents = get_font(face, size, weight).text_extents(text)
+        _extents_cache[key] = extents
+    return extents
+
+
+def _crosshair_path(size: int) -> cairo.Path:
+    path = _crosshair_paths.get(size)
+    if path is None:
+        cr = _scratch()
+        cr.new_path()
+        cr.move_to(-size, 0)
+        cr.line_to(size, 0)
+        cr.move_to(0, -size)
+        cr.line_to(0, size)
+        path = cr.copy_path()
+        cr.new_path()
+        _crosshair_paths[size] = path
+    return path
+
+
+def prewarm(crosshair_size: int = 15) -> None:
+    """Build the lazily cached fonts, paths and panels ahead of the first frame."""
+    get_font("monospace", 14, cairo.FONT_WEIGHT_BOLD)
+    _text_extents("0", 14, "monospace", cairo.FONT_WEIGHT_BOLD)
+    _text_extents("0123456789 x", 14, "monospace", cairo.FONT_WEIGHT_BOLD)
+    _crosshair_path(crosshair_size)
+    _instructions_panel(20, 30)
+
 
 def draw_crosshair(cr: cairo.Context, x: float, y: float, size: int = 15):
     """Draw a crosshair cursor at the given position."""
+    # The same cached path is appended for both strokes; translating keeps
+    # it position independent (line widths are unaffected by translation)
+    path = _crosshair_path(size)
+    cr.save()
+    cr.translate(x, y)
+
     # Black outline
+    cr.new_path()
+    cr.append_path(path)
     cr.set_source_rgb(0, 0, 0)
     cr.set_line_width(3)
-    cr.move_to(x - size, y)
-    cr.line_to(x + size, y)
-    cr.move_to(x, y - size)
-    cr.line_to(x, y + size)
     cr.stroke()
 
     # White center
+    cr.append_path(path)
     cr.set_source_rgb(1, 1, 1)
     cr.set_line_width(1)
-    cr.move_to(x - size, y)
-    cr.line_to(x + size, y)
-    cr.move_to(x, y - size)
-    cr.line_to(x, y + size)
     cr.stroke()
 
+    cr.restore()
+
 
 def draw_selection_overlay(
     cr: cairo.Context,
@@ -51,21 +136,24 @@ def draw_selection_overlay(
 
 def draw_dimension_text(cr: cairo.Context, x: int, y: int, width: int, height: int):
     """Draw dimension text in the center of a selection."""
-    cr.select_font_face("monospace", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-    cr.set_font_size(14)
+    cr.set_scaled_font(get_font("monospace", 14, cairo.FONT_WEIGHT_BOLD))
     dim_text = f"{width} x {height}"
-    extents = cr.text_extents(dim_text)
+    # Monospace: the width follows from one cached advance, and every such
+    # label is digits and "x", so one cached height covers them all
+    char = _text_extents("0", 14, "monospace", cairo.FONT_WEIGHT_BOLD)
+    text_w = len(dim_text) * char.x_advance
+    text_h = _text_extents("0123456789 x", 14, "monospace", cairo.FONT_WEIGHT_BOLD).height
 
-    text_x = x + width / 2 - extents.width / 2
-    text_y = y + height / 2 + extents.height / 2
+    text_x = x + width / 2 - text_w / 2
+    text_y = y + height / 2 + text_h / 2
 
     # Background
     cr.set_source_rgba(0, 0, 0, 0.8)
     cr.rectangle(
         text_x - 5,
-        text_y - extents.height - 5,
-        extents.width + 10,
-        extents.height + 10,
+        text_y - text_h - 5,
+        text_w + 10,
+        text_h + 10,
     )
     cr.fill()
 
@@ -76,20 +164,34 @@ def draw_dimension_text(cr: cairo.Context, x: int, y: int, width: int, height: i
 
 
 def draw_instructions(cr: cairo.Context, x: int = 20, y: int = 30):
-    """Draw help instructions in the corner."""
-    instructions = [
-        "Click window: Capture window",
-        "Drag: Select area",
-        "PrintScreen: Full screen",
-        "Arrow keys: Fine adjust",
-        "ESC/Right-click: Cancel",
-    ]
-
-    cr.select_font_face("sans-serif", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
-    cr.set_font_size(14)
-
-    for instruction in instructions:
-        extents = cr.text_extents(instruction)
+    """Draw help instructions in the corner.
+
+    The panel is rendered once per position into a small surface; each
+    frame is then a single blit.
+    """
+    surface, bx, by = _instructions_panel(x, y)
+    cr.set_source_surface(surface, bx, by)
+    cr.paint()
+
+
+def _instructions_panel(x: int, y: int) -> tuple[cairo.ImageSurface, int, int]:
+    cached = _instructions_surfaces.get((x, y))
+    if cached is None:
+        bx, by, bw, bh = instructions_bounds(x, y)
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, bw, bh)
+        panel_cr = cairo.Context(surface)
+        panel_cr.translate(-bx, -by)
+        _paint_instructions(panel_cr, x, y)
+        surface.flush()
+        cached = _instructions_surfaces[(x, y)] = (surface, bx, by)
+    return cached
+
+
+def _paint_instructions(cr: cairo.Context, x: int, y: int):
+    cr.set_scaled_font(get_font("sans-serif", 14))
+
+    for instruction in INSTRUCTIONS:
+        extents = _text_extents(instruction, 14, "sans-serif")
         # Background
         cr.set_source_rgba(0, 0, 0, 0.7)
         cr.rectangle(x - 5, y - extents.height - 2, extents.width + 10, extents.height + 6)
@@ -101,30 +203,47 @@ def draw_instructions(cr: cairo.Context, x: int = 20, y: int = 30):
         y += 22
 
 
-def draw_window_highlight(
-    cr: cairo.Context,
-    window: dict,
-    all_windows: list[dict],
-    screenshot,
-):
-    """Draw highlight for hovered window, respecting z-order."""
-    import gi
-    gi.require_version("Gdk", "3.0")
-    from gi.repository import Gdk
+def instructions_bounds(x: int = 20, y: int = 30) -> tuple[int, int, int, int]:
+    """Area touched by draw_instructions, as (x, y, width, height)."""
+    extents = [_text_extents(line, 14, "sans-serif") for line in INSTRUCTIONS]
+    width = max(e.width for e in extents) + 10
+    top = y - max(e.height for e in extents) - 2
+    bottom = y + 22 * (len(INSTRUCTIONS) - 1) + 4
+    return int(x - 5) - 1, int(top) - 1, int(width) + 3, int(bottom - top) + 3
 
+
+def front_overlaps(window: dict, all_windows: list[dict]) -> list[tuple[int, int, int, int]]:
+    """Intersections of window with the windows in front of it, as (x, y, w, h)."""
     win_z = window.get("z_order", 999)
     wx, wy = window["x"], window["y"]
     ww, wh = window["width"], window["height"]
 
-    # Collect front windows that overlap with hovered window
-    front_windows = []
+    overlaps = []
     for other_win in all_windows:
         if other_win.get("z_order", 999) < win_z:
             ox, oy = other_win["x"], other_win["y"]
-            ow, oh = other_win["width"], other_win["height"]
-            # Check overlap
-            if not (ox >= wx + ww or ox + ow <= wx or oy >= wy + wh or oy + oh <= wy):
-                front_windows.append(other_win)
+            ix = max(wx, ox)
+            iy = max(wy, oy)
+            iw = min(wx + ww, ox + other_win["width"]) - ix
+            ih = min(wy + wh, oy + other_win["height"]) - iy
+            if iw > 0 and ih > 0:
+                overlaps.append((ix, iy, iw, ih))
+    return overlaps
+
+
+def draw_window_highlight(
+    cr: cairo.Context,
+    window: dict,
+    overlaps: list[tuple[int, int, int, int]],
+    screenshot: cairo.Surface,
+):
+    """Draw highlight for hovered window, respecting z-order.
+
+    overlaps comes from front_overlaps(); screenshot is the background
+    surface, repainted there so front windows stay unhighlighted.
+    """
+    wx, wy = window["x"], window["y"]
+    ww, wh = window["width"], window["height"]
 
     # Draw highlight, then "erase" front windows by redrawing background
     cr.save()
@@ -135,16 +254,14 @@ def draw_window_highlight(
     cr.set_source_rgba(0.3, 0.6, 1.0, 0.3)
     cr.paint()
 
-    # Paint screenshot back over front window areas (removes highlight there)
-    for other_win in front_windows:
-        ox, oy = other_win["x"], other_win["y"]
-        ow, oh = other_win["width"], other_win["height"]
-        cr.save()
-        cr.rectangle(ox, oy, ow, oh)
+    # Paint screenshot back over the overlaps (removes highlight there);
+    # the rectangles share one winding clip, so this is a single paint
+    if overlaps:
+        for rect in overlaps:
+            cr.rectangle(*rect)
         cr.clip()
-        Gdk.cairo_set_source_pixbuf(cr, screenshot, 0, 0)
+        cr.set_source_surface(screenshot, 0, 0)
         cr.paint()
-        cr.restore()
 
     cr.restore()
 
@@ -1,11 +1,11 @@
 """Magnifier component for pixel-perfect positioning."""
 
 import math
+from typing import Optional
 
 import cairo
-import gi
-gi.require_version("Gdk", "3.0")
-from gi.repository import Gdk
+
+from .drawing import get_font
 
 
 class Magnifier:
@@ -22,25 +22,54 @@ class Magnifier:
         self.zoom = zoom
         self.pixels_shown = 9  # 9x9 grid
 
-    def draw(
+        # Upscaled pixels around the cursor, rebuilt when the source pixel
+        # or screenshot changes
+        self._tile: Optional[cairo.ImageSurface] = None
+        self._tile_key: Optional[tuple[int, int, int]] = None
+
+        # Grid lines relative to the grid's top-left corner; replayed by draw()
+        span = self.pixels_shown * self.zoom
+        path_cr = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+        for i in range(self.pixels_shown + 1):
+            path_cr.move_to(i * self.zoom, 0)
+            path_cr.line_to(i * self.zoom, span)
+        for i in range(self.pixels_shown + 1):
+            path_cr.move_to(0, i * self.zoom)
+            path_cr.line_to(span, i * self.zoom)
+        self._grid_path = path_cr.copy_path()
+
+    def _get_tile(self, screenshot: cairo.Surface, src_x: int, src_y: int) -> cairo.ImageSurface:
+        """Return the pixels_shown square starting at src_x/src_y, zoomed."""
+        key = (src_x, src_y, id(screenshot))
+        if key != self._tile_key:
+            size = self.pixels_shown * self.zoom
+            if self._tile is None or self._tile.get_width() != size:
+                self._tile = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+            tile_cr = cairo.Context(self._tile)
+            # Parts past the screenshot edge stay transparent, as before
+            tile_cr.set_operator(cairo.OPERATOR_SOURCE)
+            tile_cr.scale(self.zoom, self.zoom)
+            tile_cr.translate(-src_x, -src_y)
+            tile_cr.set_source_surface(screenshot, 0, 0)
+            tile_cr.get_source().set_filter(cairo.FILTER_NEAREST)
+            tile_cr.paint()
+            self._tile.flush()
+            self._tile_key = key
+        return self._tile
+
+    def prewarm(self, screenshot: cairo.Surface, cursor_x: float, cursor_y: float) -> None:
+        """Build the label font and the tile for the initial cursor position."""
+        get_font("monospace", 12, cairo.FONT_WEIGHT_BOLD)
+        self._get_tile(screenshot, max(0, int(cursor_x) - 4), max(0, int(cursor_y) - 4))
+
+    def _position(
         self,
-        cr: cairo.Context,
         cursor_x: float,
         cursor_y: float,
-        screenshot,
         img_width: int,
         img_height: int,
-    ):
-        """Draw the magnifier at the appropriate position.
-
-        Args:
-            cr: Cairo context
-            cursor_x: Current cursor X position
-            cursor_y: Current cursor Y position
-            screenshot: GdkPixbuf screenshot
-            img_width: Screenshot width
-            img_height: Screenshot height
-        """
+    ) -> tuple[float, float]:
+        """Top-left corner of the magnifier circle's bounding square."""
         diameter = self.radius * 2
 
         # Position magnifier to avoid cursor
@@ -56,6 +85,50 @@ class Magnifier:
             mag_y = cursor_y + 40
         if mag_y + diameter > img_height:
             mag_y = img_height - diameter - 40
+        return mag_x, mag_y
+
+    def bounds(
+        self,
+        cursor_x: float,
+        cursor_y: float,
+        img_width: int,
+        img_height: int,
+    ) -> tuple[int, int, int, int]:
+        """Area touched by draw() for this cursor, as (x, y, width, height).
+
+        Covers the border stroke and the coordinates label underneath.
+        """
+        mag_x, mag_y = self._position(cursor_x, cursor_y, img_width, img_height)
+        # Border: radius + 2 plus half of its 3px stroke
+        pad = 4
+        # Label: centred, at most ~100px either side, ending ~25px below
+        half_w = max(self.radius + pad, 100)
+        center_x = mag_x + self.radius
+        x = int(center_x - half_w) - 1
+        y = int(mag_y) - pad - 1
+        return x, y, 2 * half_w + 2, self.radius * 2 + pad + 25 + 2
+
+    def draw(
+        self,
+        cr: cairo.Context,
+        cursor_x: float,
+        cursor_y: float,
+        screenshot,
+        img_width: int,
+        img_height: int,
+    ):
+        """Draw the magnifier at the appropriate position.
+
+        Args:
+            cr: Cairo context
+            cursor_x: Current cursor X position
+            cursor_y: Current cursor Y position
+            screenshot: Screenshot as a Cairo surface
+            img_width: Screenshot width
+            img_height: Screenshot height
+        """
+        diameter = self.radius * 2
+        mag_x, mag_y = self._position(cursor_x, cursor_y, img_width, img_height)
 
         center_x = mag_x + self.radius
         center_y = mag_y + self.radius
@@ -81,36 +154,26 @@ class Magnifier:
         draw_x = center_x - (self.pixels_shown * self.zoom) / 2
         draw_y = center_y - (self.pixels_shown * self.zoom) / 2
 
-        cr.save()
-        cr.translate(draw_x, draw_y)
-        cr.scale(self.zoom, self.zoom)
-        cr.translate(-src_x, -src_y)
-        Gdk.cairo_set_source_pixbuf(cr, screenshot, 0, 0)
+        # pixels_shown * zoom equals the diameter for the defaults, so the
+        # tile covers everything the circle clip lets through
+        cr.set_source_surface(self._get_tile(screenshot, src_x, src_y), draw_x, draw_y)
         cr.get_source().set_filter(cairo.FILTER_NEAREST)
         cr.paint()
-        cr.restore()
-
-        # Grid lines
-        cr.save()
-        cr.arc(center_x, center_y, self.radius, 0, 2 * math.pi)
-        cr.clip()
 
+        # Grid lines (still inside the circle clip above)
         grid_start_x = center_x - (self.pixels_shown * self.zoom) / 2
         grid_start_y = center_y - (self.pixels_shown * self.zoom) / 2
 
         cr.set_source_rgba(0.3, 0.3, 0.3, 0.6)
         cr.set_line_width(1)
 
-        for i in range(self.pixels_shown + 1):
-            line_x = grid_start_x + i * self.zoom
-            cr.move_to(line_x, grid_start_y)
-            cr.line_to(line_x, grid_start_y + self.pixels_shown * self.zoom)
-        for i in range(self.pixels_shown + 1):
-            line_y = grid_start_y + i * self.zoom
-            cr.move_to(grid_start_x, line_y)
-            cr.line_to(grid_start_x + self.pixels_shown * self.zoom, line_y)
-        cr.stroke()
+        # The path is fixed in device space once appended, so the translate
+        # can be undone before stroking
+        cr.save()
+        cr.translate(grid_start_x, grid_start_y)
+        cr.append_path(self._grid_path)
         cr.restore()
+        cr.stroke()
 
         # Center pixel highlight
         cr.save()
@@ -136,10 +199,10 @@ class Magnifier:
         cursor_y: float,
     ):
         """Draw coordinates below the magnifier."""
-        cr.select_font_face("monospace", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        cr.set_font_size(12)
+        font = get_font("monospace", 12, cairo.FONT_WEIGHT_BOLD)
+        cr.set_scaled_font(font)
         coord_text = f"({int(cursor_x)}, {int(cursor_y)})"
-        extents = cr.text_extents(coord_text)
+        extents = font.text_extents(coord_text)
 
         text_x = center_x - extents.width / 2
         text_y = bottom_y + 15
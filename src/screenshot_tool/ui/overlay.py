@@ -3,8 +3,8 @@
 import logging
 import os
 import signal
-import tempfile
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -17,14 +17,19 @@ gi.require_version("GdkPixbuf", "2.0")
 from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, GtkLayerShell
 
 from ..config import Config, get_config
-from ..capture import fullscreen as capture_fullscreen, window as capture_window
+from ..capture import (
+    fullscreen_bytes as capture_fullscreen,
+    invalidate_list_cache,
+    window_bytes as capture_window,
+)
 from ..emit import emit
-from ..output import OutputOptions, save, save_pixbuf
+from ..output import OutputOptions, load_pixbuf, save, save_surface
 from ..wayfire import (
     get_cursor_position,
     get_window_geometries,
     hide_cursor,
     show_cursor,
+    shutdown_wayfire,
     focus_screenshot_tool,
 )
 from .drawing import (
@@ -33,6 +38,9 @@ from .drawing import (
     draw_instructions,
     draw_selection_overlay,
     draw_window_highlight,
+    front_overlaps,
+    instructions_bounds,
+    prewarm as prewarm_drawing,
 )
 from .magnifier import Magnifier
 
@@ -41,19 +49,31 @@ log = logging.getLogger(__name__)
 # Global instance for signal handler
 _overlay_instance: Optional["ScreenshotOverlay"] = None
 
+# Matches draw_crosshair's default size
+_CROSSHAIR_SIZE = 15
+
+Rect = tuple[int, int, int, int]
+
+
+def _intersects(rect: Rect, clip: tuple[float, float, float, float]) -> bool:
+    """Whether an (x, y, w, h) rect overlaps clip extents (x1, y1, x2, y2)."""
+    x, y, w, h = rect
+    return x < clip[2] and x + w > clip[0] and y < clip[3] and y + h > clip[1]
+
 
 def _operation_type() -> str:
     return "screenshot.capture"
 
 
 def _start_operation(mode: str) -> str:
-    operation_id = str(uuid.uuid4())
-    emit("operation.started", {
-        "operation_type": _operation_type(),
-        "operation_id": operation_id,
-        "mode": mode,
-        "monitor": None,
-    })
+    operation_id = uuid.uuid4().hex
+    if get_config().emit_progress_events:
+        emit("operation.started", {
+            "operation_type": _operation_type(),
+            "operation_id": operation_id,
+            "mode": mode,
+            "monitor": None,
+        })
     return operation_id
 
 
@@ -77,6 +97,30 @@ def _complete_operation(
     emit("operation.completed", payload)
 
 
+def _build_bg_surface(pixbuf: GdkPixbuf.Pixbuf) -> cairo.ImageSurface:
+    """Copy the screenshot into an RGB24 surface the overlay paints from."""
+    surface = cairo.ImageSurface(cairo.FORMAT_RGB24, pixbuf.get_width(), pixbuf.get_height())
+    cr = cairo.Context(surface)
+    Gdk.cairo_set_source_pixbuf(cr, pixbuf, 0, 0)
+    cr.paint()
+    surface.flush()
+    return surface
+
+
+def _ipc_result(future: Future, default):
+    """Result of a background Wayfire query, or default if it failed.
+
+    Waits for the query to finish rather than giving up early: each one is
+    already bounded by the IPC socket timeout, and an abandoned query would
+    still be running when the main thread next uses the connection.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        log.debug("Wayfire query failed: %s", e)
+        return default
+
+
 def _glib_signal_handler():
     """Handle SIGUSR1 via GLib for GTK compatibility."""
     global _overlay_instance
@@ -106,27 +150,53 @@ class ScreenshotOverlay(Gtk.Window):
         GtkLayerShell.set_exclusive_zone(self, -1)  # Cover entire screen
         GtkLayerShell.set_keyboard_mode(self, GtkLayerShell.KeyboardMode.EXCLUSIVE)
 
-        # Get window geometries BEFORE capturing (for window selection)
-        self.windows = get_window_geometries()
-        log.debug("Got %d windows", len(self.windows))
-
-        # Capture the current screen BEFORE showing window
-        self._temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-        self._temp_file.close()
+        # Window geometries (for window selection) and the cursor position
+        # are fetched in the background while the screen is captured. Both
+        # use the one shared Wayfire connection, so a single worker runs
+        # them back to back.
+        ipc = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wayfire-ipc")
+        windows_future = ipc.submit(get_window_geometries)
+        cursor_future = ipc.submit(get_cursor_position)
+        ipc.shutdown(wait=False)
+
+        # Capture the current screen BEFORE showing window. Outputs may have
+        # been hotplugged since an earlier selection in this process, so the
+        # output/window list is probed afresh
+        invalidate_list_cache()
         try:
-            temp_path = capture_fullscreen(config=self.config)
-            # Move to our temp file location
-            temp_path.rename(self._temp_file.name)
+            # Kept in memory: wayland-capture hands back the PNG through a
+            # memfd/pipe, so no temp file is written or read back
+            png = capture_fullscreen(config=self.config)
         except Exception as e:
             log.error("Failed to capture screen: %s", e)
             raise
 
-        # Load the screenshot
-        self.screenshot = GdkPixbuf.Pixbuf.new_from_file(self._temp_file.name)
+        # Decode the screenshot straight from the captured bytes
+        self.screenshot = load_pixbuf(png)
+        del png
         self.img_width = self.screenshot.get_width()
         self.img_height = self.screenshot.get_height()
         log.debug("Screenshot loaded: %dx%d", self.img_width, self.img_height)
 
+        self.windows = _ipc_result(windows_future, [])
+        log.debug("Got %d windows", len(self.windows))
+        # Hit-test bounds (x1, y1, x2, y2) in z-order (front first), so motion
+        # events do no per-window dict lookups
+        self._win_bounds = []
+        for window in self.windows:
+            wx = window.get("x", 0)
+            wy = window.get("y", 0)
+            self._win_bounds.append(
+                (wx, wy, wx + window.get("width", 0), wy + window.get("height", 0), window)
+            )
+        # Window id -> its overlaps with windows in front, for the highlight
+        self._front_of = {w["id"]: front_overlaps(w, self.windows) for w in self.windows}
+        self._last_hit: Optional[tuple] = None
+
+        # Convert to a Cairo surface once; every frame sources from it
+        # instead of re-wrapping the pixbuf
+        self._bg_surface = _build_bg_surface(self.screenshot)
+
         # Window setup
         self.set_decorated(False)
         self.set_skip_taskbar_hint(True)
@@ -146,7 +216,7 @@ class ScreenshotOverlay(Gtk.Window):
         self.hovered_window: Optional[dict] = None
 
         # Get initial cursor position
-        cursor_pos = get_cursor_position()
+        cursor_pos = _ipc_result(cursor_future, None)
         if cursor_pos and 0 <= cursor_pos[0] < self.img_width and 0 <= cursor_pos[1] < self.img_height:
             self.current_x = float(cursor_pos[0])
             self.current_y = float(cursor_pos[1])
@@ -174,6 +244,16 @@ class ScreenshotOverlay(Gtk.Window):
         # Magnifier
         self.magnifier = Magnifier()
 
+        # Cursor-dependent areas painted by the last queued frame; motion
+        # only repaints these plus the new frame's areas
+        self._dirty_rects: list[Rect] = self._damage_rects()
+        self._last_frame = self._frame_key()
+        self._instructions_rect = instructions_bounds()
+
+        # Fill the drawing caches now so the first frame doesn't build them
+        prewarm_drawing(_CROSSHAIR_SIZE)
+        self.magnifier.prewarm(self._bg_surface, self.current_x, self.current_y)
+
         self.show_all()
 
         # Hide the cursor after window is shown
@@ -191,44 +271,110 @@ class ScreenshotOverlay(Gtk.Window):
 
     def _find_window_at(self, x: float, y: float) -> Optional[dict]:
         """Find the topmost window containing the given coordinates."""
-        for window in self.windows:
-            wx = window.get("x", 0)
-            wy = window.get("y", 0)
-            ww = window.get("width", 0)
-            wh = window.get("height", 0)
-            if wx <= x < wx + ww and wy <= y < wy + wh:
+        # Motion mostly stays inside one window: it is still the answer if
+        # the point is inside it and outside every window overlapping it
+        # from the front, which is usually a much shorter list than all
+        last = self._last_hit
+        if last is not None:
+            x1, y1, x2, y2, window = last
+            if x1 <= x < x2 and y1 <= y < y2 and not any(
+                ox <= x < ox + ow and oy <= y < oy + oh
+                for ox, oy, ow, oh in self._front_of[window["id"]]
+            ):
+                return window
+
+        for bounds in self._win_bounds:
+            x1, y1, x2, y2, window = bounds
+            if x1 <= x < x2 and y1 <= y < y2:
+                self._last_hit = bounds
                 return window
         return None
 
+    def _damage_rects(self) -> list[Rect]:
+        """Areas whose content depends on the cursor and selection state."""
+        rects = [self.magnifier.bounds(self.current_x, self.current_y, self.img_width, self.img_height)]
+
+        # Crosshair, including half of its 3px outline stroke
+        size = _CROSSHAIR_SIZE + 2
+        cx, cy = int(self.current_x), int(self.current_y)
+        rects.append((cx - size, cy - size, 2 * size + 1, 2 * size + 1))
+
+        if self.selecting and self.start_x is not None:
+            x, y, w, h = self._selection_rect()
+            # Border stroke, plus the centred dimension label, which can be
+            # wider than a small selection
+            rects.append((x - 2, y - 2, w + 4, h + 4))
+            rects.append((x + w // 2 - 80, y + h // 2 - 20, 160, 40))
+        elif self.hovered_window:
+            win = self.hovered_window
+            rects.append((win["x"] - 3, win["y"] - 3, win["width"] + 6, win["height"] + 6))
+        return rects
+
+    def _selection_rect(self) -> Rect:
+        """Selection from the drag start to the cursor, in whole pixels."""
+        x1, x2 = sorted((self.start_x, self.current_x))
+        y1, y2 = sorted((self.start_y, self.current_y))
+        return int(x1), int(y1), int(x2 - x1), int(y2 - y1)
+
+    def _frame_key(self) -> tuple:
+        """What the cursor-dependent layers show, at whole-pixel resolution."""
+        rect = self._selection_rect() if self.selecting and self.start_x is not None else None
+        return (int(self.current_x), int(self.current_y), rect, id(self.hovered_window))
+
+    def _queue_damage(self):
+        """Queue a redraw of the previous and current cursor-dependent areas."""
+        # Sub-pixel pointer motion changes nothing worth repainting
+        key = self._frame_key()
+        if key == self._last_frame:
+            return
+        self._last_frame = key
+
+        rects = self._damage_rects()
+        area = self.drawing_area
+        for x, y, w, h in self._dirty_rects:
+            area.queue_draw_area(x, y, w, h)
+        for x, y, w, h in rects:
+            area.queue_draw_area(x, y, w, h)
+        self._dirty_rects = rects
+
+    def _queue_full_redraw(self):
+        self._last_frame = self._frame_key()
+        self._dirty_rects = self._damage_rects()
+        self.drawing_area.queue_draw()
+
     def _on_draw(self, widget, cr):
+        # GTK clips to the queued damage; skip layers that lie outside it
+        clip = cr.clip_extents()
+
         # Draw the frozen screenshot
-        Gdk.cairo_set_source_pixbuf(cr, self.screenshot, 0, 0)
+        cr.set_source_surface(self._bg_surface, 0, 0)
         cr.get_source().set_filter(cairo.FILTER_NEAREST)
         cr.paint()
 
         # Highlight hovered window if not dragging
         if not self.selecting and self.hovered_window:
-            draw_window_highlight(cr, self.hovered_window, self.windows, self.screenshot)
+            win = self.hovered_window
+            if _intersects((win["x"] - 3, win["y"] - 3, win["width"] + 6, win["height"] + 6), clip):
+                draw_window_highlight(cr, win, self._front_of[win["id"]], self._bg_surface)
 
         # Draw selection rectangle if dragging
         if self.selecting and self.start_x is not None:
-            x = int(min(self.start_x, self.current_x))
-            y = int(min(self.start_y, self.current_y))
-            w = int(abs(self.current_x - self.start_x))
-            h = int(abs(self.current_y - self.start_y))
+            x, y, w, h = self._selection_rect()
 
             draw_selection_overlay(cr, x, y, w, h, self.img_width, self.img_height)
             draw_dimension_text(cr, x, y, w, h)
 
         # Draw magnifier and crosshair
-        self.magnifier.draw(
-            cr, self.current_x, self.current_y,
-            self.screenshot, self.img_width, self.img_height
-        )
-        draw_crosshair(cr, self.current_x, self.current_y)
+        if _intersects(self.magnifier.bounds(self.current_x, self.current_y, self.img_width, self.img_height), clip):
+            self.magnifier.draw(
+                cr, self.current_x, self.current_y,
+                self._bg_surface, self.img_width, self.img_height
+            )
+        draw_crosshair(cr, self.current_x, self.current_y, _CROSSHAIR_SIZE)
 
         # Draw instructions
-        draw_instructions(cr)
+        if _intersects(self._instructions_rect, clip):
+            draw_instructions(cr)
 
         return False
 
@@ -241,7 +387,8 @@ class ScreenshotOverlay(Gtk.Window):
             self.selecting = True
             self.start_x = self.current_x
             self.start_y = self.current_y
-            widget.queue_draw()
+            # The dimming outside the selection covers the whole screen
+            self._queue_full_redraw()
         return True
 
     def _on_button_release(self, widget, event):
@@ -265,10 +412,7 @@ class ScreenshotOverlay(Gtk.Window):
                 self._take_screenshot(0, 0, self.img_width, self.img_height)
         else:
             # Drag selection
-            x = int(min(self.start_x, self.end_x))
-            y = int(min(self.start_y, self.end_y))
-            w = int(abs(self.end_x - self.start_x))
-            h = int(abs(self.end_y - self.start_y))
+            x, y, w, h = self._selection_rect()
             if w > 0 and h > 0:
                 self._take_screenshot(x, y, w, h)
 
@@ -281,7 +425,7 @@ class ScreenshotOverlay(Gtk.Window):
         if not self.selecting:
             self.hovered_window = self._find_window_at(self.current_x, self.current_y)
 
-        widget.queue_draw()
+        self._queue_damage()
         return True
 
     def _on_key_press(self, widget, event):
@@ -303,7 +447,7 @@ class ScreenshotOverlay(Gtk.Window):
         if moved:
             if not self.selecting:
                 self.hovered_window = self._find_window_at(self.current_x, self.current_y)
-            widget.queue_draw()
+            self._queue_damage()
             return True
 
         # Cancel
@@ -319,10 +463,7 @@ class ScreenshotOverlay(Gtk.Window):
 
         # Confirm selection with Enter
         if event.keyval == Gdk.KEY_Return and self.selecting:
-            x = int(min(self.start_x, self.current_x))
-            y = int(min(self.start_y, self.current_y))
-            w = int(abs(self.current_x - self.start_x))
-            h = int(abs(self.current_y - self.start_y))
+            x, y, w, h = self._selection_rect()
             if w > 0 and h > 0:
                 self._take_screenshot(x, y, w, h)
             return True
@@ -343,9 +484,8 @@ class ScreenshotOverlay(Gtk.Window):
                 _complete_operation(operation_id, "window", error_message="window has no app_id")
                 return
 
-            temp_path = capture_window(app_id, config=self.config)
-            result = save(temp_path, OutputOptions(), self.config)
-            temp_path.unlink(missing_ok=True)
+            png = capture_window(app_id, config=self.config)
+            result = save(png, OutputOptions(), self.config)
             _complete_operation(operation_id, "window", output_path=str(result.path))
         except Exception as e:
             emit("error.handled", {"error_type": "CaptureError", "message": str(e), "mode": "window"})
@@ -359,8 +499,9 @@ class ScreenshotOverlay(Gtk.Window):
         mode = "instant" if (x, y, w, h) == (0, 0, self.img_width, self.img_height) else "region"
         operation_id = _start_operation(mode)
         try:
-            cropped = self.screenshot.new_subpixbuf(x, y, w, h)
-            result = save_pixbuf(cropped, OutputOptions(), self.config)
+            # Shares the background surface's pixels; Cairo encodes from it
+            cropped = self._bg_surface.create_for_rectangle(x, y, w, h)
+            result = save_surface(cropped, w, h, OutputOptions(), self.config)
             _complete_operation(operation_id, mode, output_path=str(result.path))
         except Exception as e:
             emit("error.handled", {"error_type": "CaptureError", "message": str(e), "mode": mode})
@@ -374,11 +515,6 @@ class ScreenshotOverlay(Gtk.Window):
         global _overlay_instance
         _overlay_instance = None
 
-        try:
-            os.unlink(self._temp_file.name)
-        except OSError:
-            pass
-
         self.hide()
         self.destroy()
         Gtk.main_quit()
@@ -411,5 +547,6 @@ def run_interactive(config: Optional[Config] = None) -> int:
         Gtk.main()
     finally:
         show_cursor()
+        shutdown_wayfire()
 
     return 0
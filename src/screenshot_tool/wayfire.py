@@ -8,25 +8,106 @@ This module handles:
 - Window focusing (to bring screenshot-tool to front)
 """
 
+import functools
 import json
 import logging
+import threading
 from typing import Optional
 
 log = logging.getLogger(__name__)
 
 
+def _frame(payload: bytes) -> bytes:
+    """Prefix an IPC payload with its little-endian 32-bit length."""
+    return len(payload).to_bytes(4, byteorder="little") + payload
+
+
+# Constant requests, encoded and framed once
+_MSG_IS_HIDDEN = _frame(json.dumps({"method": "cursor-control/is-hidden", "data": {}}).encode("utf8"))
+_MSG_HIDE = _frame(json.dumps({"method": "cursor-control/hide", "data": {}}).encode("utf8"))
+_MSG_SHOW = _frame(json.dumps({"method": "cursor-control/show", "data": {}}).encode("utf8"))
+
+
+# One connection per process, opened on first use and dropped after an IPC
+# error so the next call reconnects
+_socket_lock = threading.Lock()
+_socket_instance = None
+
+# Held for a whole request/response exchange, so queries from a background
+# thread (the overlay's startup prefetch) cannot interleave with the main
+# thread's on the shared connection
+_request_lock = threading.Lock()
+
+
+def _serialized(func):
+    """Run func with exclusive use of the shared IPC connection."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _request_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
 def _get_socket():
-    """Get a Wayfire IPC socket, or None if unavailable."""
+    """Get the shared Wayfire IPC socket, or None if unavailable."""
+    global _socket_instance
+    with _socket_lock:
+        if _socket_instance is None:
+            try:
+                from wayfire import WayfireSocket
+                sock = WayfireSocket()
+                sock.client.settimeout(1.0)
+            except Exception as e:
+                log.debug("Wayfire IPC unavailable: %s", e)
+                return None
+            _socket_instance = sock
+        return _socket_instance
+
+
+def _drop_socket(sock) -> None:
+    """Close sock and forget it if it is still the shared connection."""
+    global _socket_instance
+    with _socket_lock:
+        if _socket_instance is sock:
+            _socket_instance = None
     try:
-        from wayfire import WayfireSocket
-        sock = WayfireSocket()
-        sock.client.settimeout(1.0)
-        return sock
-    except Exception as e:
-        log.debug("Wayfire IPC unavailable: %s", e)
-        return None
+        sock.close()
+    except Exception:
+        pass
+
+
+def _recv_exact(sock, n: int) -> bytes:
+    """Read exactly n bytes from the IPC socket."""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.client.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("Wayfire IPC socket closed")
+        buf += chunk
+    return bytes(buf)
+
+
+def _request(sock, message: bytes) -> dict:
+    """Send a framed request and return the decoded reply.
+
+    Unlike WayfireSocket.read_message, an "error" reply is returned rather
+    than raised, so callers can tell it apart from a broken connection:
+    any exception raised here means the socket is unusable.
+    """
+    sock.client.send(message)
+    length = int.from_bytes(_recv_exact(sock, 4), byteorder="little")
+    return json.loads(_recv_exact(sock, length))
 
 
+@_serialized
+def shutdown_wayfire() -> None:
+    """Close the shared IPC connection, if one is open."""
+    sock = _socket_instance
+    if sock is not None:
+        _drop_socket(sock)
+
+
+@_serialized
 def is_cursor_hidden() -> bool:
     """Check if cursor is currently hidden."""
     sock = _get_socket()
@@ -34,20 +115,16 @@ def is_cursor_hidden() -> bool:
         return False
 
     try:
-        msg = json.dumps({"method": "cursor-control/is-hidden", "data": {}}).encode("utf8")
-        sock.client.send(len(msg).to_bytes(4, byteorder="little") + msg)
+        sock.client.send(_MSG_IS_HIDDEN)
         result = sock.read_message()
         return result.get("hidden", False)
     except Exception as e:
+        _drop_socket(sock)
         log.debug("Could not check cursor state: %s", e)
         return False
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
 
 
+@_serialized
 def hide_cursor() -> bool:
     """Hide cursor using Wayfire cursor-control plugin.
 
@@ -59,28 +136,21 @@ def hide_cursor() -> bool:
         return False
 
     try:
-        # Check if already hidden
-        msg = json.dumps({"method": "cursor-control/is-hidden", "data": {}}).encode("utf8")
-        sock.client.send(len(msg).to_bytes(4, byteorder="little") + msg)
-        result = sock.read_message()
-        if result.get("hidden", False):
-            return True  # Already hidden
-
-        # Hide it
-        msg = json.dumps({"method": "cursor-control/hide", "data": {}}).encode("utf8")
-        sock.client.send(len(msg).to_bytes(4, byteorder="little") + msg)
-        sock.read_message()
-        return True
+        # Hiding is idempotent, so no is-hidden probe: one round trip
+        reply = _request(sock, _MSG_HIDE)
     except Exception as e:
+        _drop_socket(sock)
         log.warning("Could not hide cursor via IPC: %s", e)
         return False
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
 
+    # A server error reply (e.g. already hidden) still means it is hidden,
+    # and the connection is fine, so keep it
+    if "error" in reply:
+        log.debug("cursor-control/hide replied: %s", reply["error"])
+    return True
 
+
+@_serialized
 def show_cursor() -> bool:
     """Show cursor using Wayfire cursor-control plugin.
 
@@ -92,20 +162,20 @@ def show_cursor() -> bool:
         return False
 
     try:
-        msg = json.dumps({"method": "cursor-control/show", "data": {}}).encode("utf8")
-        sock.client.send(len(msg).to_bytes(4, byteorder="little") + msg)
-        sock.read_message()
-        return True
+        # Idempotent like hide_cursor: a single request, no state probe
+        reply = _request(sock, _MSG_SHOW)
     except Exception as e:
+        _drop_socket(sock)
         log.warning("Could not show cursor via IPC: %s", e)
         return False
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
+
+    # As in hide_cursor: an error reply (e.g. already shown) keeps the socket
+    if "error" in reply:
+        log.debug("cursor-control/show replied: %s", reply["error"])
+    return True
 
 
+@_serialized
 def get_cursor_position() -> Optional[tuple[int, int]]:
     """Get current cursor position.
 
@@ -120,15 +190,12 @@ def get_cursor_position() -> Optional[tuple[int, int]]:
         cursor_pos = sock.get_cursor_position()
         return (int(cursor_pos[0]), int(cursor_pos[1]))
     except Exception as e:
+        _drop_socket(sock)
         log.debug("Could not get cursor position: %s", e)
         return None
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
 
 
+@_serialized
 def get_window_geometries() -> list[dict]:
     """Get window positions sorted by z-order (front to back).
 
@@ -182,17 +249,13 @@ def get_window_geometries() -> list[dict]:
             window["z_order"] = i
 
     except Exception as e:
+        _drop_socket(sock)
         log.warning("Could not get window geometries: %s", e)
 
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
-
     return windows
 
 
+@_serialized
 def focus_screenshot_tool() -> bool:
     """Focus the screenshot-tool window to bring it to front.
 
@@ -205,23 +268,29 @@ def focus_screenshot_tool() -> bool:
 
     try:
         views = sock.list_views()
-        for view in views:
-            if view.get("app-id") == "screenshot-tool":
-                view_id = view.get("id")
-                msg = json.dumps({
-                    "method": "wm-actions/set-focus",
-                    "data": {"id": view_id}
-                }).encode("utf8")
-                sock.client.send(len(msg).to_bytes(4, byteorder="little") + msg)
-                sock.read_message()
-                return True
     except Exception as e:
+        _drop_socket(sock)
         log.warning("Could not focus screenshot-tool: %s", e)
         return False
-    finally:
+
+    for view in views:
+        view_id = view.get("id")
+        # Only a view with an integer id can be focused; skip anything else
+        # here rather than fail on the request and drop the connection
+        if view.get("app-id") != "screenshot-tool" or not isinstance(view_id, int):
+            continue
+        message = _frame(
+            b'{"method":"wm-actions/set-focus","data":{"id":%d}}' % view_id
+        )
         try:
-            sock.close()
-        except Exception:
-            pass
+            reply = _request(sock, message)
+        except Exception as e:
+            _drop_socket(sock)
+            log.warning("Could not focus screenshot-tool: %s", e)
+            return False
+        if "error" in reply:
+            log.warning("Could not focus screenshot-tool: %s", reply["error"])
+            return False
+        return True
 
     return False